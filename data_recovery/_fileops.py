@@ -0,0 +1,69 @@
+"""
+File moving helpers shared by the organizers.
+
+A move is a rename whenever source and target share a filesystem; only a
+cross-device move copies the bytes, and the source is deleted only once the
+copy is known to be complete.
+"""
+
+import errno
+import os
+import shutil
+from pathlib import Path
+from typing import Union
+
+PathLike = Union[str, Path]
+
+
+def _copy_file_range(source: PathLike, target: PathLike) -> None:
+    """Copy file contents inside the kernel, as a reflink where the filesystem supports it."""
+    with open(source, 'rb') as fsrc, open(target, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                # Some filesystems report 0 instead of an error; never treat a short copy as done
+                raise OSError(errno.EIO, f"copy_file_range stopped with {remaining} bytes left", str(source))
+            remaining -= copied
+
+
+def move_across_devices(source: PathLike, target: PathLike) -> None:
+    """Copy then delete, keeping the bytes out of userspace where the platform allows."""
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            _copy_file_range(source, target)
+            copied = True
+        except OSError:
+            # Not supported between these filesystems (or kernels); fall through
+            pass
+    try:
+        if copied:
+            shutil.copystat(source, target)
+        else:
+            # copy2 truncates whatever a failed copy_file_range left behind, and
+            # hands the bytes to sendfile on Linux, so this stays in-kernel too
+            shutil.copy2(source, target)
+
+        source_size = os.stat(source).st_size
+        target_size = os.stat(target).st_size
+        if target_size != source_size:
+            raise OSError(errno.EIO, f"Copy is {target_size} bytes, expected {source_size}; source kept", str(target))
+    except BaseException:
+        # Never leave a partial copy under the real name for the next run to collide with
+        try:
+            os.unlink(target)
+        except OSError:
+            pass
+        raise
+    os.unlink(source)
+
+
+def rename_or_move(source: PathLike, target: PathLike) -> None:
+    """Rename in place when possible; copy and delete only across filesystems."""
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        move_across_devices(source, target)
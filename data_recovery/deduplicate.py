@@ -10,27 +10,162 @@ for cleaning up duplicate photos across multiple batch directories.
 import os
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Set, Optional, Tuple, Union
 import argparse
+import fnmatch
 import logging
+import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import groupby, islice
 import json
+import sqlite3
+import threading
 import time
 
+try:
+    import msgpack
+except ImportError:  # Optional: only needed for the binary hash database
+    msgpack = None
+
+try:
+    import xxhash
+except ImportError:  # Optional: only needed for the xxh3 algorithms
+    xxhash = None
+
+
+# Files at least this large have their digests updated on a thread pool when
+# several algorithms are requested (hashlib releases the GIL on large buffers)
+MULTI_HASH_THREAD_THRESHOLD = 4 * 1024 * 1024
+MULTI_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Default read size when hashing; the read buffer is reused between files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Non-cryptographic algorithms provided by the optional xxhash package
+XXHASH_ALGORITHMS = {"xxh3_64", "xxh3_128"}
+
+# Hash database files with these suffixes use the binary (msgpack) format
+BINARY_DB_SUFFIXES = {'.msgpack', '.mpk'}
+
+# Sort keys for choose_file_to_keep: the file with the smallest key is kept.
+# Each key function takes the path and its stat result (None unless the
+# strategy is listed in _STAT_STRATEGIES).
+_KEEP_STRATEGIES = {
+    "shortest_path": lambda path, st: len(str(path)),
+    "oldest": lambda path, st: st.st_mtime,
+    "newest": lambda path, st: -st.st_mtime,
+    "largest_name": lambda path, st: -len(path.name),
+    "first_alphabetical": lambda path, st: str(path).lower(),
+}
+_STAT_STRATEGIES = {"oldest", "newest"}
+
+# Number of paths read from the directory walk (and written to the spill
+# database) at a time
+SCAN_BATCH_SIZE = 10_000
+
+# Files handed to the hashing threads at a time, per thread
+HASH_BATCH_PER_THREAD = 64
+
+
+def _hash_constructor(algorithm: str) -> Callable:
+    """Resolve a hash algorithm name to its constructor once, up front."""
+    if algorithm in XXHASH_ALGORITHMS:
+        if xxhash is None:
+            raise ImportError(f"xxhash is required for {algorithm} (pip install xxhash)")
+        return getattr(xxhash, algorithm)
+    
+    constructor = getattr(hashlib, algorithm, None) if algorithm in hashlib.algorithms_guaranteed else None
+    return constructor or partial(hashlib.new, algorithm)
+
+
+def _compile_patterns(patterns: Optional[List[str]]) -> Optional[Callable[[str], bool]]:
+    """
+    Compile glob patterns into one test over a lowercased file name.
+    
+    Patterns of the form "*.ext" become a single str.endswith() over a tuple of
+    suffixes; anything else is folded into one combined regular expression.
+    """
+    if not patterns:
+        return None
+    
+    suffixes = []
+    others = []
+    for pattern in (p.lower() for p in patterns):
+        if pattern.startswith('*') and not any(c in pattern[1:] for c in '*?['):
+            suffixes.append(pattern[1:])
+        else:
+            others.append(pattern)
+    
+    suffixes = tuple(suffixes)
+    regex_match = re.compile('|'.join(fnmatch.translate(p) for p in others)).match if others else None
+    
+    if not others:
+        return lambda name: name.endswith(suffixes)
+    if not suffixes:
+        return lambda name: regex_match(name) is not None
+    return lambda name: name.endswith(suffixes) or regex_match(name) is not None
+
+
+def _compile_name_matcher(include_patterns: Optional[List[str]] = None,
+                          exclude_patterns: Optional[List[str]] = None) -> Callable[[str], bool]:
+    """Build a case-insensitive file name filter for a fixed set of include/exclude patterns."""
+    include = _compile_patterns(include_patterns)
+    exclude = _compile_patterns(exclude_patterns)
+    
+    if include is None and exclude is None:
+        return lambda name: True
+    if exclude is None:
+        return lambda name: include(name.lower())
+    if include is None:
+        return lambda name: not exclude(name.lower())
+    
+    def match(name: str) -> bool:
+        name = name.lower()
+        return include(name) and not exclude(name)
+    return match
+
 
 class FileDuplicateRemover:
     """Find and remove duplicate files based on content hash."""
     
-    def __init__(self, dry_run: bool = False, hash_algorithm: str = "sha256"):
+    def __init__(self, dry_run: bool = False, hash_algorithm: Union[str, List[str]] = "sha256",
+                 delete_threads: int = 1, spill_threshold: int = 100_000,
+                 incremental: bool = False, hash_threads: int = 1):
         """
         Initialize the duplicate remover.
         
         Args:
             dry_run: If True, only report what would be done without actual removal
-            hash_algorithm: Hash algorithm to use (sha256, md5, sha1)
+            hash_algorithm: Hash algorithm to use (sha256, md5, sha1), or a list of
+                            algorithms to compute together in a single pass
+            delete_threads: Number of threads used to delete duplicates. Values above 1
+                            help on network storage where each unlink is slow.
+            spill_threshold: Scans with more files than this keep their paths and hashes
+                             in a temporary SQLite database instead of in memory
+            incremental: If True, record (mtime, size, hash) per path and reuse the hash
+                         of files unchanged since the index loaded by load_file_index
+            hash_threads: Number of threads used to hash files during a scan
         """
         self.dry_run = dry_run
         self.hash_algorithm = hash_algorithm
+        self._resolve_hash_constructors()
+        self.delete_threads = delete_threads
+        self.spill_threshold = spill_threshold
+        self._spill_db: Optional[sqlite3.Connection] = None
+        self.incremental = incremental
+        # path -> (mtime_ns, size, hash) from the previous run, and for this run
+        self._previous_index: Dict[str, Tuple[int, int, str]] = {}
+        self.file_index: Dict[str, Tuple[int, int, str]] = {}
+        self.reused_hashes = 0
+        # Guards reused_hashes, which hash_threads workers update concurrently
+        self._reused_lock = threading.Lock()
+        self.hash_threads = hash_threads
+        self._local = threading.local()
+        # Updates several hashers of one large file concurrently; created on first use
+        self._digest_pool: Optional[ThreadPoolExecutor] = None
+        self._digest_pool_lock = threading.Lock()
         self.logger = self._setup_logging()
         self.file_hashes: Dict[str, List[Path]] = defaultdict(list)
         self.processed_files = 0
@@ -46,7 +181,15 @@ class FileDuplicateRemover:
         )
         return logging.getLogger(__name__)
     
-    def calculate_file_hash(self, file_path: Path, chunk_size: int = 8192) -> Optional[str]:
+    def _resolve_hash_constructors(self) -> None:
+        """Look up the constructor(s) for the configured hash algorithm(s)."""
+        if isinstance(self.hash_algorithm, str):
+            self._hash_ctor = _hash_constructor(self.hash_algorithm)
+        else:
+            self._hash_ctors = {algorithm: _hash_constructor(algorithm) for algorithm in self.hash_algorithm}
+    
+    def calculate_file_hash(self, file_path: Union[str, Path],
+                            chunk_size: int = HASH_CHUNK_SIZE) -> Optional[Union[str, Dict[str, str]]]:
         """
         Calculate hash of a file.
         
@@ -55,21 +198,63 @@ class FileDuplicateRemover:
             chunk_size: Size of chunks to read at a time (in bytes)
             
         Returns:
-            Hex digest of the file hash, or None if error
+            Hex digest of the file hash, or a dict mapping algorithm to hex digest
+            when several algorithms are configured. None if error.
         """
         try:
-            hash_obj = hashlib.new(self.hash_algorithm)
-            
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(chunk_size):
-                    hash_obj.update(chunk)
+            if isinstance(self.hash_algorithm, str):
+                hash_obj = self._hash_ctor()
+                buffer = self._read_buffer(chunk_size)
+                
+                with open(file_path, 'rb', buffering=0) as f:
+                    while size := f.readinto(buffer):
+                        hash_obj.update(buffer[:size])
+                
+                return hash_obj.hexdigest()
             
-            return hash_obj.hexdigest()
+            return self._calculate_multi_digest(file_path, chunk_size)
         
         except (OSError, IOError) as e:
             self.logger.error(f"Error reading file {file_path}: {e}")
             return None
     
+    def _read_buffer(self, size: int) -> memoryview:
+        """Return this thread's reusable read buffer, sliced to size and grown only when too small."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None or len(buffer) < size:
+            buffer = self._local.buffer = memoryview(bytearray(size))
+        return buffer[:size]
+    
+    def _get_digest_pool(self) -> ThreadPoolExecutor:
+        """Return the pool shared by every large multi-algorithm hash, creating it once."""
+        with self._digest_pool_lock:
+            if self._digest_pool is None:
+                # Enough for every hash thread to update all of its hashers at once
+                workers = len(self._hash_ctors) * max(1, self.hash_threads)
+                self._digest_pool = ThreadPoolExecutor(max_workers=workers)
+            return self._digest_pool
+    
+    def _calculate_multi_digest(self, file_path: Union[str, Path], chunk_size: int) -> Dict[str, str]:
+        """Read a file once and feed every chunk to all configured hashers."""
+        hashers = {algorithm: ctor() for algorithm, ctor in self._hash_ctors.items()}
+        
+        with open(file_path, 'rb', buffering=0) as f:
+            if len(hashers) > 1 and os.fstat(f.fileno()).st_size >= MULTI_HASH_THREAD_THRESHOLD:
+                # Large file: update the hashers concurrently on each chunk
+                buffer = self._read_buffer(max(chunk_size, MULTI_HASH_CHUNK_SIZE))
+                executor = self._get_digest_pool()
+                while size := f.readinto(buffer):
+                    chunk = buffer[:size]
+                    list(executor.map(lambda h: h.update(chunk), hashers.values()))
+            else:
+                buffer = self._read_buffer(chunk_size)
+                while size := f.readinto(buffer):
+                    chunk = buffer[:size]
+                    for hash_obj in hashers.values():
+                        hash_obj.update(chunk)
+        
+        return {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in hashers.items()}
+    
     def scan_directory(self, directory: Path, include_patterns: Optional[List[str]] = None,
                       exclude_patterns: Optional[List[str]] = None, recursive: bool = True) -> None:
         """
@@ -86,64 +271,239 @@ class FileDuplicateRemover:
         
         self.logger.info(f"Scanning directory: {directory}")
         
-        # Get all files to process
-        if recursive:
-            all_files = [f for f in directory.rglob('*') if f.is_file()]
-        else:
-            all_files = [f for f in directory.iterdir() if f.is_file()]
+        self.scan_and_group(directory, include_patterns, exclude_patterns, recursive)
         
-        # Filter files based on patterns
-        files_to_process = self._filter_files(all_files, include_patterns, exclude_patterns)
+        self.logger.info(f"Processed {self.processed_files} files")
+        if self.incremental:
+            self.logger.info(f"Reused {self.reused_hashes} hashes of unchanged files")
+    
+    def scan_and_group(self, directory: Path, include_patterns: Optional[List[str]] = None,
+                       exclude_patterns: Optional[List[str]] = None, recursive: bool = True) -> None:
+        """
+        Walk, filter, hash and group files in a single streaming pass.
         
-        self.total_files = len(files_to_process)
-        self.logger.info(f"Found {self.total_files} files to process")
+        No intermediate file list is built: each batch of paths coming off the
+        walk is hashed (on hash_threads threads) and added straight to
+        file_hashes. If more than spill_threshold files are grouped, the rest
+        of the walk is handed to the on-disk database.
         
-        # Process files
-        for file_path in files_to_process:
-            self._process_file(file_path)
+        Args:
+            directory: Directory to scan
+            include_patterns: List of file patterns to include
+            exclude_patterns: List of file patterns to exclude
+            recursive: Whether to scan subdirectories recursively
+        """
+        # Paths stay plain strings until they are stored
+        matches = _compile_name_matcher(include_patterns, exclude_patterns)
+        files = (path for path, name in self._iter_files(directory, recursive) if matches(name))
+        
+        # The total is unknown until the walk is finished
+        self.total_files = 0
+        # The threshold covers everything grouped in memory, including earlier scans
+        grouped = sum(map(len, self.file_hashes.values()))
+        executor = ThreadPoolExecutor(max_workers=self.hash_threads) if self.hash_threads > 1 else None
+        try:
+            if self._spill_db is not None or grouped > self.spill_threshold:
+                self._scan_spilled(files, executor)
+                return
+            
+            batch_size = HASH_BATCH_PER_THREAD * max(1, self.hash_threads)
+            # Never hash more than one file past the threshold in memory
+            while batch := list(islice(files, min(batch_size, self.spill_threshold + 1 - grouped))):
+                for file_path, file_hash in zip(batch, self._map_hashes(batch, executor)):
+                    if file_hash:
+                        self.file_hashes[file_hash].append(Path(file_path))
+                        self._report_progress()
+                        grouped += 1
+                
+                if grouped > self.spill_threshold:
+                    self._scan_spilled(files, executor)
+                    return
+        finally:
+            if executor:
+                executor.shutdown()
+        
+        self.total_files = grouped
+    
+    def _map_hashes(self, paths: List[str], executor: Optional[ThreadPoolExecutor]) -> Iterator[Optional[str]]:
+        """Hash a batch of files, in order, on the executor if there is one."""
+        if executor:
+            return executor.map(self._hash_key, paths)
+        return map(self._hash_key, paths)
+    
+    def _iter_files(self, directory: Path, recursive: bool) -> Iterator[Tuple[str, str]]:
+        """Lazily yield (path, name) for the regular files in a directory."""
+        pending = [os.fspath(directory)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path, entry.name
+            except OSError as e:
+                self.logger.warning(f"Cannot read directory: {e}")
+    
+    def _open_spill_db(self) -> sqlite3.Connection:
+        """Create the temporary database used for scans above spill_threshold."""
+        # An empty filename gives a private on-disk database that SQLite deletes on close
+        db = sqlite3.connect("")
+        db.execute("CREATE TABLE files (path TEXT, size INTEGER, hash TEXT)")
+        
+        # Move anything already hashed in memory across so it is still compared;
+        # the size is needed to pair these files with ones found later
+        rows = []
+        for hash_val, paths in self.file_hashes.items():
+            for path in paths:
+                try:
+                    size = os.stat(path).st_size
+                except OSError:
+                    size = None
+                rows.append((str(path), size, hash_val))
+        db.executemany("INSERT INTO files (path, size, hash) VALUES (?, ?, ?)", rows)
+        self.file_hashes = defaultdict(list)
+        return db
+    
+    def _scan_spilled(self, files: Iterator[str], executor: Optional[ThreadPoolExecutor] = None) -> None:
+        """
+        Two-pass scan backed by the spill database.
+        
+        Pass 1 records the size of every file. Pass 2 hashes only files whose
+        size occurs more than once, since a file with a unique size cannot have
+        a duplicate. Such files are not hashed and are left out of saved hash
+        databases.
+        """
+        if self._spill_db is None:
+            self.logger.info(f"More than {self.spill_threshold} files, using on-disk hash database")
+            self._spill_db = self._open_spill_db()
+        db = self._spill_db
+        
+        # Pass 1: sizes
+        scan_start = db.execute("SELECT COALESCE(MAX(rowid), 0) FROM files").fetchone()[0]
+        while batch := list(islice(files, SCAN_BATCH_SIZE)):
+            rows = []
+            for file_path in batch:
+                try:
+                    rows.append((file_path, os.stat(file_path).st_size))
+                except OSError as e:
+                    self.logger.error(f"Error reading file {file_path}: {e}")
+            db.executemany("INSERT INTO files (path, size) VALUES (?, ?)", rows)
+        db.execute("CREATE INDEX IF NOT EXISTS files_size ON files (size)")
+        
+        # Group the sizes once; pass 2 then probes this table's primary key
+        # instead of regrouping the whole files table for every batch
+        db.execute("DROP TABLE IF EXISTS dup_sizes")
+        db.execute("CREATE TEMP TABLE dup_sizes (size INTEGER PRIMARY KEY)")
+        db.execute(
+            "INSERT INTO dup_sizes SELECT size FROM files WHERE size IS NOT NULL "
+            "GROUP BY size HAVING COUNT(*) >= 2"
+        )
+        
+        found = db.execute("SELECT COUNT(*) FROM files WHERE rowid > ?", (scan_start,)).fetchone()[0]
+        # CROSS JOIN keeps files as the outer loop, so batches walk it in rowid order
+        candidates_query = (
+            "FROM files CROSS JOIN dup_sizes ON dup_sizes.size = files.size "
+            "WHERE files.hash IS NULL"
+        )
+        queued = db.execute(f"SELECT COUNT(*) {candidates_query}").fetchone()[0]
+        # processed_files already counts the files hashed before this pass
+        self.total_files = self.processed_files + queued
+        self.logger.info(f"Found {found} files, {queued} share a size and need hashing")
+        
+        # Pass 2: hash size collisions, a batch of rows at a time
+        last_rowid = 0
+        while rows := db.execute(
+            f"SELECT files.rowid, files.path {candidates_query} AND files.rowid > ? "
+            "ORDER BY files.rowid LIMIT ?",
+            (last_rowid, SCAN_BATCH_SIZE)
+        ).fetchall():
+            updates = []
+            hashes = self._map_hashes([path for _, path in rows], executor)
+            for (rowid, _), file_hash in zip(rows, hashes):
+                if file_hash:
+                    updates.append((file_hash, rowid))
+                    self._report_progress()
+            db.executemany("UPDATE files SET hash = ? WHERE rowid = ?", updates)
+            last_rowid = rows[-1][0]
+        db.execute("CREATE INDEX IF NOT EXISTS files_hash ON files (hash)")
+        db.execute("DROP TABLE dup_sizes")
+        db.commit()
+    
+    def close(self) -> None:
+        """Close the spill database, if a scan opened one (its hashes are discarded), and the hashing pool."""
+        if self._spill_db is not None:
+            self._spill_db.close()
+            self._spill_db = None
+        with self._digest_pool_lock:
+            if self._digest_pool is not None:
+                self._digest_pool.shutdown()
+                self._digest_pool = None
     
     def _filter_files(self, files: List[Path], include_patterns: Optional[List[str]] = None,
                      exclude_patterns: Optional[List[str]] = None) -> List[Path]:
         """Filter files based on include/exclude patterns."""
-        import fnmatch
-        
-        filtered_files = files
-        
-        # Apply include patterns
-        if include_patterns:
-            included_files = []
-            for file_path in filtered_files:
-                for pattern in include_patterns:
-                    if fnmatch.fnmatch(file_path.name.lower(), pattern.lower()):
-                        included_files.append(file_path)
-                        break
-            filtered_files = included_files
-        
-        # Apply exclude patterns
-        if exclude_patterns:
-            excluded_files = []
-            for file_path in filtered_files:
-                should_exclude = False
-                for pattern in exclude_patterns:
-                    if fnmatch.fnmatch(file_path.name.lower(), pattern.lower()):
-                        should_exclude = True
-                        break
-                if not should_exclude:
-                    excluded_files.append(file_path)
-            filtered_files = excluded_files
-        
-        return filtered_files
-    
-    def _process_file(self, file_path: Path) -> None:
-        """Process a single file and add to hash database."""
+        matches = _compile_name_matcher(include_patterns, exclude_patterns)
+        return [f for f in files if matches(f.name)]
+    
+    def _hash_key(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Hash a file and return the string used to group it with duplicates."""
+        if self.incremental:
+            return self._hash_key_incremental(file_path)
+        
         file_hash = self.calculate_file_hash(file_path)
+        if isinstance(file_hash, dict):
+            # Files are only duplicates if every requested digest matches
+            file_hash = "".join(file_hash.values())
+        return file_hash
+    
+    def _hash_key_incremental(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Reuse the previous hash if the file's mtime and size are unchanged."""
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            self.logger.error(f"Error reading file {file_path}: {e}")
+            return None
+        
+        path_str = str(file_path)
+        previous = self._previous_index.get(path_str)
+        if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+            file_hash = previous[2]
+            with self._reused_lock:
+                self.reused_hashes += 1
+        else:
+            file_hash = self.calculate_file_hash(file_path)
+            if isinstance(file_hash, dict):
+                file_hash = "".join(file_hash.values())
+        
         if file_hash:
-            self.file_hashes[file_hash].append(file_path)
-            self.processed_files += 1
-            
-            if self.processed_files % 100 == 0 or self.processed_files == self.total_files:
-                progress = (self.processed_files / self.total_files) * 100
-                self.logger.info(f"Progress: {self.processed_files}/{self.total_files} ({progress:.1f}%)")
+            self.file_index[path_str] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+    
+    def _report_progress(self) -> None:
+        """Count a processed file and periodically log progress."""
+        self.processed_files += 1
+        
+        if not self.total_files:
+            # Streaming scan: the total is not known yet
+            if self.processed_files % 100 == 0:
+                self.logger.info(f"Progress: {self.processed_files} files")
+        elif self.processed_files % 100 == 0 or self.processed_files == self.total_files:
+            progress = (self.processed_files / self.total_files) * 100
+            self.logger.info(f"Progress: {self.processed_files}/{self.total_files} ({progress:.1f}%)")
+    
+    def _iter_hash_groups(self) -> Iterator[Tuple[str, List[Path]]]:
+        """Yield (hash, paths) for every hashed file, wherever they are stored."""
+        if self._spill_db is None:
+            yield from self.file_hashes.items()
+            return
+        
+        rows = self._spill_db.execute(
+            "SELECT hash, path FROM files WHERE hash IS NOT NULL ORDER BY hash, rowid"
+        )
+        for hash_val, group in groupby(rows, key=lambda row: row[0]):
+            yield hash_val, [Path(path) for _, path in group]
     
     def find_duplicates(self) -> Dict[str, List[Path]]:
         """
@@ -152,13 +512,25 @@ class FileDuplicateRemover:
         Returns:
             Dictionary mapping hash to list of duplicate file paths
         """
-        duplicates = {hash_val: paths for hash_val, paths in self.file_hashes.items() if len(paths) > 1}
+        if self._spill_db is None:
+            duplicates = {hash_val: paths for hash_val, paths in self.file_hashes.items() if len(paths) > 1}
+        else:
+            rows = self._spill_db.execute(
+                "SELECT hash, path FROM files WHERE hash IN "
+                "(SELECT hash FROM files WHERE hash IS NOT NULL GROUP BY hash HAVING COUNT(*) >= 2) "
+                "ORDER BY hash, rowid"
+            )
+            duplicates = {
+                hash_val: [Path(path) for _, path in group]
+                for hash_val, group in groupby(rows, key=lambda row: row[0])
+            }
         self.duplicates_found = sum(len(paths) - 1 for paths in duplicates.values())  # Total duplicates to remove
         
         self.logger.info(f"Found {len(duplicates)} sets of duplicates ({self.duplicates_found} files to remove)")
         return duplicates
     
-    def choose_file_to_keep(self, duplicate_files: List[Path], strategy: str = "shortest_path") -> Path:
+    def choose_file_to_keep(self, duplicate_files: List[Path], strategy: str = "shortest_path",
+                            stat_cache: Optional[Dict[Path, os.stat_result]] = None) -> Path:
         """
         Choose which file to keep from a set of duplicates.
         
@@ -170,6 +542,8 @@ class FileDuplicateRemover:
                      - "newest": Keep newest file (by modification time)
                      - "largest_name": Keep file with longest filename
                      - "first_alphabetical": Keep first file alphabetically
+            stat_cache: Optional dict of path -> stat result, filled in as files
+                        are stat'ed so callers can reuse the results
         
         Returns:
             Path of the file to keep
@@ -180,19 +554,19 @@ class FileDuplicateRemover:
         if len(duplicate_files) == 1:
             return duplicate_files[0]
         
-        if strategy == "shortest_path":
-            return min(duplicate_files, key=lambda f: len(str(f)))
-        elif strategy == "oldest":
-            return min(duplicate_files, key=lambda f: f.stat().st_mtime)
-        elif strategy == "newest":
-            return max(duplicate_files, key=lambda f: f.stat().st_mtime)
-        elif strategy == "largest_name":
-            return max(duplicate_files, key=lambda f: len(f.name))
-        elif strategy == "first_alphabetical":
-            return min(duplicate_files, key=lambda f: str(f).lower())
-        else:
+        key_func = _KEEP_STRATEGIES.get(strategy)
+        if key_func is None:
             self.logger.warning(f"Unknown strategy '{strategy}', using 'shortest_path'")
-            return min(duplicate_files, key=lambda f: len(str(f)))
+            key_func = _KEEP_STRATEGIES["shortest_path"]
+        elif strategy in _STAT_STRATEGIES:
+            if stat_cache is None:
+                stat_cache = {}
+            for file_path in duplicate_files:
+                if file_path not in stat_cache:
+                    stat_cache[file_path] = file_path.stat()
+            return min(duplicate_files, key=lambda f: key_func(f, stat_cache[f]))
+        
+        return min(duplicate_files, key=lambda f: key_func(f, None))
     
     def remove_duplicates(self, duplicates: Dict[str, List[Path]], 
                          keep_strategy: str = "shortest_path") -> None:
@@ -205,34 +579,74 @@ class FileDuplicateRemover:
         """
         self.logger.info(f"Removing duplicates using '{keep_strategy}' strategy")
         
+        to_remove: List[Tuple[Path, int]] = []
         removed_count = 0
         
         for file_hash, duplicate_files in duplicates.items():
-            # Choose which file to keep
-            file_to_keep = self.choose_file_to_keep(duplicate_files, keep_strategy)
+            # Choose which file to keep, reusing any stat results for sizes below
+            stat_cache: Dict[Path, os.stat_result] = {}
+            file_to_keep = self.choose_file_to_keep(duplicate_files, keep_strategy, stat_cache)
             files_to_remove = [f for f in duplicate_files if f != file_to_keep]
             
             self.logger.info(f"\nDuplicate set (hash: {file_hash[:16]}...):")
             self.logger.info(f"  KEEPING: {file_to_keep}")
             
             for file_to_remove in files_to_remove:
-                file_size = file_to_remove.stat().st_size
+                file_stat = stat_cache.get(file_to_remove) or file_to_remove.stat()
+                file_size = file_stat.st_size
                 self.space_saved += file_size
                 
                 if self.dry_run:
                     self.logger.info(f"  [DRY RUN] Would remove: {file_to_remove} ({file_size / (1024**2):.1f} MB)")
                 else:
-                    try:
-                        file_to_remove.unlink()
-                        self.logger.info(f"  REMOVED: {file_to_remove} ({file_size / (1024**2):.1f} MB)")
-                        removed_count += 1
-                    except OSError as e:
-                        self.logger.error(f"  ERROR removing {file_to_remove}: {e}")
+                    to_remove.append((file_to_remove, file_size))
+            
+            # Serially, delete each set as it is reported; only a pool is worth batching for
+            if self.delete_threads <= 1:
+                removed_count += self._unlink_files(to_remove)
+                to_remove = []
+        
+        removed_count += self._unlink_files(to_remove)
         
         if not self.dry_run:
             self.logger.info(f"\nSuccessfully removed {removed_count} duplicate files")
         self.logger.info(f"Total space {'that would be ' if self.dry_run else ''}saved: {self.space_saved / (1024**3):.2f} GB")
     
+    def _unlink_files(self, files: List[Tuple[Path, int]]) -> int:
+        """
+        Delete files, on a thread pool when delete_threads > 1.
+        
+        Args:
+            files: List of (path, size) tuples to delete
+            
+        Returns:
+            Number of files successfully removed
+        """
+        if self.delete_threads > 1 and len(files) > 1:
+            with ThreadPoolExecutor(max_workers=self.delete_threads) as executor:
+                futures = [executor.submit(path.unlink) for path, _ in files]
+                errors = [future.exception() for future in futures]
+        else:
+            errors = []
+            for path, _ in files:
+                try:
+                    path.unlink()
+                    errors.append(None)
+                except OSError as e:
+                    errors.append(e)
+        
+        removed_count = 0
+        for (path, file_size), error in zip(files, errors):
+            if error is None:
+                self.logger.info(f"  REMOVED: {path} ({file_size / (1024**2):.1f} MB)")
+                removed_count += 1
+            elif isinstance(error, OSError):
+                self.logger.error(f"  ERROR removing {path}: {error}")
+            else:
+                raise error
+        
+        return removed_count
+    
     def generate_report(self, duplicates: Dict[str, List[Path]], output_file: Optional[Path] = None) -> str:
         """
         Generate a detailed report of duplicates found.
@@ -274,7 +688,14 @@ class FileDuplicateRemover:
         return report
     
     def save_hash_database(self, output_file: Path) -> None:
-        """Save the hash database to a JSON file for later use."""
+        """Save the hash database to a JSON file for later use.
+        
+        Files ending in .msgpack or .mpk are written in the binary format instead.
+        """
+        if Path(output_file).suffix.lower() in BINARY_DB_SUFFIXES:
+            self.save_hash_database_binary(output_file)
+            return
+        
         hash_db = {
             "metadata": {
                 "algorithm": self.hash_algorithm,
@@ -283,9 +704,14 @@ class FileDuplicateRemover:
             },
             "hashes": {
                 hash_val: [str(path) for path in paths]
-                for hash_val, paths in self.file_hashes.items()
+                for hash_val, paths in self._iter_hash_groups()
             }
         }
+        if self.file_index:
+            hash_db["files"] = {
+                path: [mtime_ns, size, hash_val]
+                for path, (mtime_ns, size, hash_val) in self.file_index.items()
+            }
         
         with open(output_file, 'w') as f:
             json.dump(hash_db, f, indent=2)
@@ -293,19 +719,115 @@ class FileDuplicateRemover:
         self.logger.info(f"Hash database saved to: {output_file}")
     
     def load_hash_database(self, input_file: Path) -> None:
-        """Load a previously saved hash database."""
+        """Load a previously saved hash database (JSON, or binary by file suffix)."""
+        if Path(input_file).suffix.lower() in BINARY_DB_SUFFIXES:
+            self.load_hash_database_binary(input_file)
+            return
+        
         with open(input_file, 'r') as f:
             hash_db = json.load(f)
         
         self.hash_algorithm = hash_db["metadata"]["algorithm"]
+        self._resolve_hash_constructors()
         self.processed_files = hash_db["metadata"]["total_files"]
         
+        self.close()
         self.file_hashes = defaultdict(list)
         for hash_val, path_strings in hash_db["hashes"].items():
             self.file_hashes[hash_val] = [Path(p) for p in path_strings]
         
         self.logger.info(f"Loaded hash database from: {input_file}")
         self.logger.info(f"Loaded {len(self.file_hashes)} unique hashes for {self.processed_files} files")
+    
+    def save_hash_database_binary(self, output_file: Path) -> None:
+        """
+        Save the hash database in msgpack format.
+        
+        Digests are stored as raw bytes rather than hex strings, which roughly
+        halves the file size and is much faster to (de)serialize than JSON.
+        
+        Args:
+            output_file: File to write
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for binary hash databases (pip install msgpack)")
+        
+        hash_db = {
+            "metadata": {
+                "algorithm": self.hash_algorithm,
+                "generated": time.strftime('%Y-%m-%d %H:%M:%S'),
+                "total_files": self.processed_files
+            },
+            "hashes": [
+                [bytes.fromhex(hash_val), [str(path) for path in paths]]
+                for hash_val, paths in self._iter_hash_groups()
+            ]
+        }
+        if self.file_index:
+            hash_db["files"] = [
+                [path, mtime_ns, size, bytes.fromhex(hash_val)]
+                for path, (mtime_ns, size, hash_val) in self.file_index.items()
+            ]
+        
+        with open(output_file, 'wb') as f:
+            f.write(msgpack.packb(hash_db, use_bin_type=True))
+        
+        self.logger.info(f"Hash database saved to: {output_file}")
+    
+    def load_hash_database_binary(self, input_file: Path) -> None:
+        """
+        Load a hash database saved by save_hash_database_binary.
+        
+        Args:
+            input_file: File to read
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for binary hash databases (pip install msgpack)")
+        
+        with open(input_file, 'rb') as f:
+            hash_db = msgpack.unpackb(f.read(), raw=False)
+        
+        self.hash_algorithm = hash_db["metadata"]["algorithm"]
+        self._resolve_hash_constructors()
+        self.processed_files = hash_db["metadata"]["total_files"]
+        
+        self.close()
+        self.file_hashes = defaultdict(list)
+        for digest, path_strings in hash_db["hashes"]:
+            self.file_hashes[digest.hex()] = [Path(p) for p in path_strings]
+        
+        self.logger.info(f"Loaded hash database from: {input_file}")
+        self.logger.info(f"Loaded {len(self.file_hashes)} unique hashes for {self.processed_files} files")
+    
+    def load_file_index(self, input_file: Path) -> None:
+        """
+        Load the per-file (mtime, size, hash) index from a saved hash database.
+        
+        Only the index is read; duplicates still come from a fresh scan, in which
+        files whose mtime and size are unchanged reuse their stored hash.
+        
+        Args:
+            input_file: Hash database saved with incremental mode enabled
+        """
+        if Path(input_file).suffix.lower() in BINARY_DB_SUFFIXES:
+            if msgpack is None:
+                raise ImportError("msgpack is required for binary hash databases (pip install msgpack)")
+            with open(input_file, 'rb') as f:
+                hash_db = msgpack.unpackb(f.read(), raw=False)
+            entries = ((path, mtime_ns, size, digest.hex())
+                       for path, mtime_ns, size, digest in hash_db.get("files", []))
+        else:
+            with open(input_file, 'r') as f:
+                hash_db = json.load(f)
+            entries = ((path, mtime_ns, size, hash_val)
+                       for path, (mtime_ns, size, hash_val) in hash_db.get("files", {}).items())
+        
+        if hash_db["metadata"]["algorithm"] != self.hash_algorithm:
+            self.logger.warning("Hash database uses a different algorithm, ignoring file index")
+            return
+        
+        self._previous_index = {path: (mtime_ns, size, hash_val) for path, mtime_ns, size, hash_val in entries}
+        self.logger.info(f"Loaded file index with {len(self._previous_index)} entries from: {input_file}")
 
 
 def main():
@@ -325,9 +847,11 @@ def main():
     )
     parser.add_argument(
         "--hash-algorithm",
-        choices=["sha256", "md5", "sha1"],
-        default="sha256",
-        help="Hash algorithm to use (default: sha256)"
+        nargs="+",
+        choices=["sha256", "md5", "sha1", "xxh3_64", "xxh3_128"],
+        default=["sha256"],
+        help="Hash algorithm(s) to use; several are computed in one pass. "
+             "xxh3_64/xxh3_128 are much faster but need the xxhash package (default: sha256)"
     )
     parser.add_argument(
         "--include",
@@ -358,12 +882,29 @@ def main():
     parser.add_argument(
         "--save-hashes",
         type=Path,
-        help="Save hash database to JSON file"
+        help="Save hash database to file (JSON, or msgpack for .msgpack/.mpk)"
     )
     parser.add_argument(
         "--load-hashes",
         type=Path,
-        help="Load hash database from JSON file (skip scanning)"
+        help="Load hash database from file (skip scanning)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse hashes of unchanged files from the --save-hashes database and update it"
+    )
+    parser.add_argument(
+        "--hash-threads",
+        type=int,
+        default=1,
+        help="Number of threads used to hash files (default: 1)"
+    )
+    parser.add_argument(
+        "--delete-threads",
+        type=int,
+        default=1,
+        help="Number of threads used to delete duplicates, useful on network storage (default: 1)"
     )
     
     args = parser.parse_args()
@@ -373,10 +914,21 @@ def main():
         print(f"Error: Directory does not exist or is not a directory: {args.directory}")
         return 1
     
+    if args.incremental and not args.save_hashes:
+        print("Error: --incremental requires --save-hashes")
+        return 1
+    
+    hash_algorithm = args.hash_algorithm
+    if isinstance(hash_algorithm, list) and len(hash_algorithm) == 1:
+        hash_algorithm = hash_algorithm[0]
+    
     # Create deduplicator
     deduplicator = FileDuplicateRemover(
         dry_run=args.dry_run,
-        hash_algorithm=args.hash_algorithm
+        hash_algorithm=hash_algorithm,
+        delete_threads=args.delete_threads,
+        incremental=args.incremental,
+        hash_threads=args.hash_threads
     )
     
     try:
@@ -384,6 +936,9 @@ def main():
         if args.load_hashes:
             deduplicator.load_hash_database(args.load_hashes)
         else:
+            if args.incremental and args.save_hashes and args.save_hashes.exists():
+                deduplicator.load_file_index(args.save_hashes)
+            
             deduplicator.scan_directory(
                 args.directory,
                 include_patterns=args.include,
@@ -414,6 +969,9 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         return 1
+    finally:
+        # Releases the on-disk database a large scan may have spilled to
+        deduplicator.close()
 
 
 if __name__ == "__main__":
@@ -11,18 +11,130 @@ import os
 import shutil
 import argparse
 import hashlib
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Set, Tuple, Union
 import logging
+import re
+
+from ._fileops import rename_or_move
+
+try:
+    import xxhash
+except ImportError:  # Optional: only needed for the xxh3 algorithms
+    xxhash = None
+
+# Upper bound on the read buffer used when hashing a file
+HASH_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Non-cryptographic algorithms provided by the optional xxhash package
+XXHASH_ALGORITHMS = {"xxh3_64", "xxh3_128"}
+
+
+class _TargetIndex:
+    """Files in a target directory, grouped by size and hashed only on demand.
+
+    Thread-safe: claim() checks a source file against the index and records it
+    in one step, so two identical sources handled concurrently are never both moved.
+    """
+
+    def __init__(self, hash_file: Callable[[str], str]):
+        self._hash_file = hash_file
+        self._cond = threading.Condition()
+        self._size_counts: Dict[int, int] = defaultdict(int)
+        self._unhashed: Dict[int, List[str]] = defaultdict(list)
+        self._hashes: Set[Tuple[int, str]] = set()
+        # Claimed, not-yet-hashed files of each size that are still being moved
+        self._in_flight: Dict[int, int] = defaultdict(int)
+
+    def add(self, file_path: str, size: int) -> None:
+        """Record a file already in the target directory."""
+        with self._cond:
+            self._size_counts[size] += 1
+            self._unhashed[size].append(file_path)
+
+    def has_size(self, size: int) -> bool:
+        """Check whether any indexed file has this size."""
+        with self._cond:
+            return self._size_counts[size] > 0
+
+    def claim(self, file_path: str, size: int, compare_hash: bool,
+              file_hash: Optional[str] = None, record: bool = True) -> Tuple[bool, Optional[str]]:
+        """
+        Check a source file for an identical indexed file and, if there is none,
+        record it (when record is set) until finish() is called.
+
+        Hashing never holds the lock: the source and any not-yet-hashed targets
+        of this size are hashed with it released, while same-size claims wait.
+
+        Returns (is_duplicate, file_hash); file_hash is None if it was never needed.
+        """
+        hashed = file_hash is not None
+        with self._cond:
+            while True:
+                if compare_hash:
+                    # Same-size files still being moved or hashed can't be compared yet; wait for them
+                    self._cond.wait_for(lambda: not self._in_flight[size])
+
+                if not self._size_counts[size]:
+                    break
+                if not compare_hash:
+                    return True, None
+
+                targets = self._unhashed.pop(size, [])
+                if hashed and not targets:
+                    if file_hash and (size, file_hash) in self._hashes:
+                        return True, file_hash
+                    break
+
+                # Hash targets of this size the first time a source needs them
+                self._in_flight[size] += 1
+                self._cond.release()
+                try:
+                    if not hashed:
+                        file_hash = self._hash_file(file_path) or None
+                        hashed = True
+                    target_hashes = [self._hash_file(target) for target in targets]
+                finally:
+                    self._cond.acquire()
+                    self._in_flight[size] -= 1
+                    self._cond.notify_all()
+                self._hashes.update((size, h) for h in target_hashes if h)
+
+            if record:
+                self._size_counts[size] += 1
+                if file_hash:
+                    self._hashes.add((size, file_hash))
+                elif compare_hash:
+                    self._in_flight[size] += 1
+            return False, file_hash
+
+    def finish(self, size: int, file_hash: Optional[str], compare_hash: bool,
+               target_file: Optional[str]) -> None:
+        """Complete a recorded claim with where the file ended up, or None if the move failed."""
+        with self._cond:
+            if compare_hash and not file_hash:
+                self._in_flight[size] -= 1
+                if target_file is not None:
+                    self._unhashed[size].append(target_file)
+            if target_file is None:
+                self._size_counts[size] -= 1
+                if file_hash:
+                    self._hashes.discard((size, file_hash))
+            self._cond.notify_all()
 
 
 class FileExtensionOrganizer:
     """Organizes files by extension into separate directories."""
 
-    def __init__(self, source_dir: str, output_dir: str, extensions: List[str], dry_run: bool = False, copy: bool = False, check_space: bool = False, max_files: int = None, batch_size: int = 100, allow_sudo: bool = False, skip_duplicates: bool = False, remove_source_dupes: bool = False, dedupe_method: str = 'size'):
+    def __init__(self, source_dir: str, output_dir: str, extensions: List[str], dry_run: bool = False, copy: bool = False, check_space: bool = False, max_files: int = None, batch_size: int = 100, allow_sudo: bool = False, skip_duplicates: bool = False, remove_source_dupes: bool = False, dedupe_method: str = 'size', max_concurrency: int = 8, hash_algo: str = 'blake2b'):
         self.source_dir = Path(source_dir).resolve()
         self.output_dir = Path(output_dir).resolve()
-        self.extensions = {ext.lower().lstrip('.') for ext in extensions}  # Normalize extensions
+        self.extensions = frozenset(ext.lower().lstrip('.') for ext in extensions)  # Normalize extensions
+        self._ext_re = self._compile_extension_pattern(self.extensions)
         self.dry_run = dry_run
         self.copy = copy
         self.check_space = check_space
@@ -32,7 +144,26 @@ class FileExtensionOrganizer:
         self.skip_duplicates = skip_duplicates
         self.remove_source_dupes = remove_source_dupes
         self.dedupe_method = dedupe_method
+        self.max_concurrency = max_concurrency
+        if hash_algo in XXHASH_ALGORITHMS and xxhash is None:
+            raise ImportError(f"xxhash is required for {hash_algo} (pip install xxhash)")
+        self.hash_algo = hash_algo
         self.sudo_available = False
+        # Guards stats and target name reservations when files are moved concurrently
+        self._lock = threading.Lock()
+        self._reserved_targets: Set[str] = set()
+        # Next suffix number to try for each conflicting target name
+        self._next_suffix: Dict[str, int] = {}
+        # stat results recorded during an organize_files run (scan and later
+        # comparisons) so duplicate checks don't stat the same file over and
+        # over; None outside a run, where every lookup is a fresh stat
+        self._file_stats: Optional[Dict[str, os.stat_result]] = None
+        # Output directories already made, so repeat calls skip the mkdir
+        self._created_dirs: Set[Path] = set()
+        # Hashes keyed by (dev, inode, mtime_ns, size, algorithm)
+        self._hash_cache: Dict[Tuple[int, int, int, int, str], str] = {}
+        # Per-thread read buffer reused across hashes
+        self._local = threading.local()
         self.stats = {
             'processed': 0,
             'moved': 0,
@@ -85,7 +216,7 @@ class FileExtensionOrganizer:
         total_size = 0
         for file_path in files_to_process:
             try:
-                total_size += file_path.stat().st_size
+                total_size += os.stat(file_path).st_size
             except Exception as e:
                 self.logger.warning(f"Could not get size of {file_path}: {e}")
 
@@ -114,23 +245,56 @@ class FileExtensionOrganizer:
         except Exception:
             return 0
 
+    @staticmethod
+    def _compile_extension_pattern(extensions) -> 're.Pattern':
+        """
+        One regex matching names that end in any of the extensions, capturing it.
+
+        Like Path.suffix, the extension follows the last dot and needs a non-empty
+        stem, so dotfiles (".py") and names ending in a dot never match. Multi-dot
+        extensions ("tar.gz") can never be a suffix, so they are left out.
+        """
+        extensions = sorted(ext for ext in extensions if '.' not in ext)
+        if not extensions:
+            return re.compile(r'(?!)')
+        alternation = '|'.join(re.escape(ext) for ext in extensions)
+        return re.compile(rf'(?s).+\.({alternation})', re.IGNORECASE)
+
     def find_files_by_extensions(self) -> Dict[str, List[Path]]:
         """Find all files with the specified extensions."""
+        return {ext: [Path(p) for p in paths] for ext, paths in self._find_files().items()}
+
+    def _find_files(self) -> Dict[str, List[str]]:
+        """Walk the source tree and bucket matching files by extension, as plain str paths."""
         files_by_ext = {ext: [] for ext in self.extensions}
 
         self.logger.info(f"Scanning {self.source_dir} for files with extensions: {', '.join(self.extensions)}")
 
-        for file_path in self.source_dir.rglob('*'):
-            if file_path.is_file():
-                # Get extension without the dot and normalize to lowercase
-                file_ext = file_path.suffix.lower().lstrip('.')
-
-                if file_ext in self.extensions:
-                    files_by_ext[file_ext].append(file_path)
-                    self.stats['processed'] += 1
+        ext_re = self._ext_re
+        stat_cache = self._file_stats if self.skip_duplicates else None
+        # Iterative scandir walk: entry types come from the directory listing,
+        # so regular files and directories cost no extra stat() call
+        pending = [str(self.source_dir)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            match = ext_re.fullmatch(entry.name)
+                            if match is not None:
+                                files_by_ext[match.group(1).lower()].append(entry.path)
+                                self.stats['processed'] += 1
+                                if stat_cache is not None:
+                                    stat_cache[entry.path] = entry.stat()
+            except OSError as e:
+                self.logger.warning(f"Cannot scan directory: {e}")
 
         # Log what we found
         for ext, files in files_by_ext.items():
+            # Sorted so sequential runs keep and rename files in the same order every time
+            files.sort()
             count = len(files)
             self.stats['by_extension'][ext] = count
             self.logger.info(f"Found {count} .{ext} files")
@@ -146,8 +310,10 @@ class FileExtensionOrganizer:
             output_dirs[ext] = ext_dir
 
             if not self.dry_run:
-                ext_dir.mkdir(parents=True, exist_ok=True)
-                self.logger.info(f"Created directory: {ext_dir}")
+                if ext_dir not in self._created_dirs:
+                    os.makedirs(ext_dir, exist_ok=True)
+                    self._created_dirs.add(ext_dir)
+                    self.logger.info(f"Created directory: {ext_dir}")
             else:
                 self.logger.info(f"DRY RUN: Would create directory: {ext_dir}")
 
@@ -155,24 +321,79 @@ class FileExtensionOrganizer:
 
     def move_file(self, source: Path, target_dir: Path) -> bool:
         """Move a file to the target directory, handling name conflicts and permissions."""
-        try:
-            target_file = target_dir / source.name
-
-            # Handle name conflicts by adding a number suffix
-            if target_file.exists():
-                counter = 1
-                stem = source.stem
-                suffix = source.suffix
+        return self._move_file(source, target_dir) is not None
 
-                while target_file.exists():
-                    target_file = target_dir / f"{stem}_{counter}{suffix}"
+    def _move_file(self, source: Union[str, Path], target_dir: Union[str, Path]) -> Optional[str]:
+        """Move (or copy) a file into target_dir and return where it ended up, or None on failure."""
+        try:
+            # Pick a free name and claim it, so concurrent moves can't choose the same one
+            with self._lock:
+                name = os.path.basename(source)
+                base_file = os.path.join(target_dir, name)
+                stem, suffix = os.path.splitext(name)
+
+                # Handle name conflicts by adding a number suffix, resuming from
+                # the last suffix used for this name instead of re-probing from 1
+                counter = self._next_suffix.get(base_file, 0)
+                while True:
+                    target_file = base_file if counter == 0 else os.path.join(target_dir, f"{stem}_{counter}{suffix}")
+                    placeholder = self._claim_name(target_file)
+                    if placeholder is not None:
+                        break
                     counter += 1
 
-                self.logger.warning(f"File conflict resolved: {source.name} -> {target_file.name}")
+                if counter:
+                    self._next_suffix[base_file] = counter + 1
+                    self.logger.warning(f"File conflict resolved: {name} -> {os.path.basename(target_file)}")
+        except Exception as e:
+            self.logger.error(f"Error moving {source}: {e}")
+            return None
+
+        result = None
+        try:
+            result = self._transfer(source, target_file)
+            return result
+        finally:
+            if result is None and placeholder:
+                try:
+                    os.unlink(target_file)
+                except OSError:
+                    pass
+            with self._lock:
+                self._reserved_targets.discard(target_file)
+
+    def _claim_name(self, target_file: str) -> Optional[bool]:
+        """
+        Claim a free target name; returns None if it is taken.
+
+        The name is claimed by creating an empty placeholder with O_EXCL, one
+        race-free syscall that the move then replaces (returns True). Dry runs, and
+        directories we can't write to without sudo, only reserve the name in
+        memory (returns False). Call with self._lock held.
+        """
+        if target_file in self._reserved_targets:
+            return None
+
+        if not self.dry_run:
+            try:
+                os.close(os.open(target_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                return True
+            except FileExistsError:
+                return None
+            except PermissionError:
+                pass
+
+        if os.path.lexists(target_file):
+            return None
+        self._reserved_targets.add(target_file)
+        return False
 
+    def _transfer(self, source: Union[str, Path], target_file: str) -> Optional[str]:
+        """Move or copy source to an already chosen target path."""
+        try:
             if self.dry_run:
                 self.logger.info(f"DRY RUN: Would move {source} -> {target_file}")
-                return True
+                return target_file
 
             # Try normal operation first
             try:
@@ -180,22 +401,22 @@ class FileExtensionOrganizer:
                     shutil.copy2(str(source), str(target_file))
                     self.logger.debug(f"Copied: {source} -> {target_file}")
                 else:
-                    shutil.move(str(source), str(target_file))
+                    rename_or_move(source, target_file)
                     self.logger.debug(f"Moved: {source} -> {target_file}")
-                return True
+                return target_file
             except PermissionError as e:
                 # Permission denied - try with sudo if allowed
                 if self.allow_sudo and self.sudo_available:
-                    return self.move_file_with_sudo(source, target_file)
+                    return target_file if self.move_file_with_sudo(source, target_file) else None
                 else:
                     self.logger.error(f"Permission denied moving {source}: {e}")
                     if self.allow_sudo:
                         self.logger.error("Try running with --sudo flag for elevated permissions")
-                    return False
+                    return None
 
         except Exception as e:
             self.logger.error(f"Error moving {source}: {e}")
-            return False
+            return None
 
     def move_file_with_sudo(self, source: Path, target_file: Path) -> bool:
         """Move a file using sudo if necessary."""
@@ -209,7 +430,8 @@ class FileExtensionOrganizer:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
                 self.logger.debug(f"Used sudo to move: {source} -> {target_file}")
-                self.stats['sudo_used'] += 1
+                with self._lock:
+                    self.stats['sudo_used'] += 1
                 return True
             else:
                 self.logger.error(f"Sudo operation failed: {result.stderr}")
@@ -218,44 +440,158 @@ class FileExtensionOrganizer:
             self.logger.error(f"Error with sudo operation: {e}")
             return False
 
-    def get_file_hash(self, file_path: Path, method: str = 'md5') -> str:
-        """Calculate file hash for duplicate detection."""
-        try:
-            if method == 'md5':
-                hash_obj = hashlib.md5()
-            elif method == 'sha256':
-                hash_obj = hashlib.sha256()
-            else:
+    def get_file_hash(self, file_path: Path, method: Optional[str] = None) -> str:
+        """Calculate file hash for duplicate detection.
+
+        method can be any algorithm name known to hashlib (blake2b, md5, sha256, ...)
+        or xxh3_64/xxh3_128 when xxhash is installed, and defaults to the
+        organizer's hash_algo.
+        """
+        method = method or self.hash_algo
+        if method in XXHASH_ALGORITHMS:
+            if xxhash is None:
                 return ""
+            new_hasher = getattr(xxhash, method)
+        elif method in hashlib.algorithms_available:
+            new_hasher = partial(hashlib.new, method)
+        else:
+            return ""
 
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_obj.update(chunk)
-            return hash_obj.hexdigest()
+        try:
+            with open(file_path, 'rb', buffering=0) as f:
+                st = os.fstat(f.fileno())
+                # The same physical, unmodified file is only ever hashed once per run
+                key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, method)
+                cached = self._hash_cache.get(key)
+                if cached is not None:
+                    return cached
+
+                if hasattr(os, 'posix_fadvise'):
+                    # Ask the kernel for aggressive readahead on this whole-file scan
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                hasher = new_hasher()
+                # Large reads keep the time in the C digest loop (SHA-NI for sha256)
+                buffer = self._read_buffer(min(st.st_size, HASH_CHUNK_SIZE) or 1)
+                while n := f.readinto(buffer):
+                    hasher.update(buffer[:n])
+                digest = self._hash_cache[key] = hasher.hexdigest()
+                return digest
         except Exception as e:
             self.logger.warning(f"Could not calculate hash for {file_path}: {e}")
             return ""
 
+    def _read_buffer(self, size: int) -> memoryview:
+        """Return this thread's reusable read buffer, sliced to size and grown only when too small."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None or len(buffer) < size:
+            buffer = self._local.buffer = memoryview(bytearray(size))
+        return buffer[:size]
+
+    def _file_stat(self, file_path: Union[str, Path]) -> os.stat_result:
+        """stat of a file, from the run's cache when it has already been stat'ed."""
+        key = os.fspath(file_path)
+        if self._file_stats is None:
+            return os.stat(key)
+        st = self._file_stats.get(key)
+        if st is None:
+            st = self._file_stats[key] = os.stat(key)
+        return st
+
+    def _file_size(self, file_path: Union[str, Path]) -> int:
+        """Size of a file, from the stat cache."""
+        return self._file_stat(file_path).st_size
+
     def files_are_identical(self, file1: Path, file2: Path) -> bool:
         """Check if two files are identical using the selected method."""
         try:
+            st1 = self._file_stat(file1)
+            st2 = self._file_stat(file2)
+
+            # Hard links to the same inode are the same file
+            if (st1.st_ino, st1.st_dev) == (st2.st_ino, st2.st_dev):
+                return True
+
+            # Files of different sizes can never match, whatever the method,
+            # so only hash when the (cached) sizes agree
+            if st1.st_size != st2.st_size:
+                return False
+
             if self.dedupe_method == 'size':
-                # Quick size comparison
-                return file1.stat().st_size == file2.stat().st_size
-            elif self.dedupe_method == 'hash':
-                # More thorough hash comparison
-                return self.get_file_hash(file1) == self.get_file_hash(file2)
-            elif self.dedupe_method == 'both':
-                # Size first (fast), then hash if sizes match
-                if file1.stat().st_size != file2.stat().st_size:
-                    return False
-                return self.get_file_hash(file1) == self.get_file_hash(file2)
+                return True
+            elif self.dedupe_method in ('hash', 'both'):
+                hash1 = self.get_file_hash(file1)
+                return bool(hash1) and hash1 == self.get_file_hash(file2)
         except Exception as e:
             self.logger.warning(f"Error comparing files {file1} and {file2}: {e}")
             return False
 
         return False
 
+    def _build_target_index(self, target_dir: str) -> _TargetIndex:
+        """Index the files already in a target directory once, before any source is checked."""
+        index = _TargetIndex(self.get_file_hash)
+        try:
+            with os.scandir(target_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        st = entry.stat()
+                        if self._file_stats is not None:
+                            self._file_stats[entry.path] = st
+                        index.add(entry.path, st.st_size)
+        except FileNotFoundError:
+            pass  # Not created yet (dry run)
+        return index
+
+    def _organize_fast(self, file_path: str, target_dir: str) -> None:
+        """Move a single source file with no duplicate checks; runs on worker threads."""
+        target_file = self._move_file(file_path, target_dir)
+        with self._lock:
+            if target_file is not None:
+                self.stats['moved'] += 1
+            else:
+                self.stats['errors'] += 1
+
+    def _organize_with_dedupe(self, file_path: str, target_dir: str, target_index: _TargetIndex) -> None:
+        """Dedupe-check and move a single source file; runs on worker threads."""
+        size = None
+        file_hash = None
+        compare_hash = self.dedupe_method != 'size'
+
+        try:
+            size = self._file_size(file_path)
+            # Hash before claiming, unless no target could match anyway
+            if compare_hash and target_index.has_size(size):
+                file_hash = self.get_file_hash(file_path) or None
+            is_duplicate, file_hash = target_index.claim(file_path, size, compare_hash, file_hash,
+                                                         record=not self.dry_run)
+        except Exception as e:
+            self.logger.warning(f"Error checking {file_path} for duplicates: {e}")
+            size = None
+            is_duplicate = False
+
+        if is_duplicate:
+            self.logger.info(f"Duplicate file detected: {os.path.basename(file_path)}")
+            with self._lock:
+                self.stats['duplicates_skipped'] += 1
+
+            # Remove the duplicate from source if requested
+            if self.remove_source_dupes and self.remove_duplicate_file(file_path):
+                with self._lock:
+                    self.stats['duplicates_removed'] += 1
+            return
+
+        target_file = self._move_file(file_path, target_dir)
+
+        # Later sources must also be checked against this file
+        if size is not None and not self.dry_run:
+            target_index.finish(size, file_hash, compare_hash, target_file)
+
+        with self._lock:
+            if target_file is not None:
+                self.stats['moved'] += 1
+            else:
+                self.stats['errors'] += 1
+
     def organize_files(self) -> Dict[str, int]:
         """Main method to organize all files by extension."""
         self.logger.info("Starting file organization by extension...")
@@ -268,22 +604,43 @@ class FileExtensionOrganizer:
         self.logger.info(f"Max files: {self.max_files}")
         self.logger.info(f"Batch size: {self.batch_size}")
 
-        # Find all files
-        files_by_ext = self.find_files_by_extensions()
+        # Files only change under us between runs, so cached stats last for this one
+        self._file_stats = {}
+        try:
+            # Find all files
+            files_by_ext = self._find_files()
+
+            if self.stats['processed'] == 0:
+                self.logger.warning("No files found with the specified extensions!")
+                return self.stats
+
+            # Create output directories
+            output_dirs = self.create_output_directories()
+
+            # Hashing and moving are I/O bound, so batches are spread over a thread pool
+            executor = ThreadPoolExecutor(max_workers=self.max_concurrency) if self.max_concurrency > 1 else None
+            try:
+                self._move_all(files_by_ext, output_dirs, executor)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+        finally:
+            self._file_stats = None
 
-        if self.stats['processed'] == 0:
-            self.logger.warning("No files found with the specified extensions!")
-            return self.stats
+        self.logger.info("Organization complete!")
+        self.logger.info(f"Statistics: {self.stats}")
 
-        # Create output directories
-        output_dirs = self.create_output_directories()
+        return self.stats
 
-        # Move files
+    def _move_all(self, files_by_ext: Dict[str, List[str]], output_dirs: Dict[str, Path],
+                  executor: Optional[ThreadPoolExecutor]) -> None:
+        """Move every found file into its extension directory, batch by batch."""
         for ext, files in files_by_ext.items():
             if not files:
                 continue
 
-            target_dir = output_dirs[ext]
+            # Directories exist from create_output_directories; moves never re-check them
+            target_dir = os.fspath(output_dirs[ext])
             self.logger.info(f"Moving {len(files)} .{ext} files to {target_dir}")
 
             # Check available space before processing
@@ -292,6 +649,13 @@ class FileExtensionOrganizer:
                 self.stats['skipped_space'] += len(files)
                 continue
 
+            # Pick the per-file worker once: the fast path has no dedupe work at all
+            if self.skip_duplicates and self.dedupe_method in ('size', 'hash', 'both'):
+                # Index the existing target files once rather than per source file
+                worker = partial(self._organize_with_dedupe, target_index=self._build_target_index(target_dir))
+            else:
+                worker = self._organize_fast
+
             # Process files in batches
             for i in range(0, len(files), self.batch_size):
                 if self.max_files and self.stats['moved'] >= self.max_files:
@@ -300,30 +664,13 @@ class FileExtensionOrganizer:
 
                 batch = files[i:i+self.batch_size]
 
-                for file_path in batch:
-                    # Skip duplicates if the option is enabled
-                    if self.skip_duplicates:
-                        # Check for duplicates in the target directory
-                        is_duplicate = any(self.files_are_identical(file_path, existing_file) for existing_file in output_dirs[ext].glob('*'))
-                        if is_duplicate:
-                            self.logger.info(f"Duplicate file detected: {file_path.name}")
-                            self.stats['duplicates_skipped'] += 1
-
-                            # Remove the duplicate from source if requested
-                            if self.remove_source_dupes:
-                                if self.remove_duplicate_file(file_path):
-                                    self.stats['duplicates_removed'] += 1
-                            continue
-
-                    if self.move_file(file_path, target_dir):
-                        self.stats['moved'] += 1
-                    else:
-                        self.stats['errors'] += 1
-
-        self.logger.info("Organization complete!")
-        self.logger.info(f"Statistics: {self.stats}")
-
-        return self.stats
+                if executor is None:
+                    for file_path in batch:
+                        worker(file_path, target_dir)
+                else:
+                    futures = [executor.submit(worker, file_path, target_dir) for file_path in batch]
+                    for future in futures:
+                        future.result()
 
     def cleanup_empty_directories(self):
         """Remove empty directories left behind after moving files."""
@@ -333,22 +680,26 @@ class FileExtensionOrganizer:
 
         self.logger.info("Cleaning up empty directories...")
 
-        # Walk from bottom up to remove empty directories
-        for dirpath, dirnames, filenames in os.walk(self.source_dir, topdown=False):
-            dir_path = Path(dirpath)
-
+        # Walk from bottom up so children are handled before their parents. A
+        # directory is empty if it holds no files and every subdirectory was
+        # removed, so no directory is listed a second time.
+        source = str(self.source_dir)
+        removed: Set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(source, topdown=False):
             # Skip the source directory itself
-            if dir_path == self.source_dir:
+            if dirpath == source:
+                continue
+
+            if filenames or any(os.path.join(dirpath, name) not in removed for name in dirnames):
                 continue
 
             try:
-                # Only remove if directory is empty
-                if not any(dir_path.iterdir()):
-                    dir_path.rmdir()
-                    self.logger.debug(f"Removed empty directory: {dir_path}")
+                os.rmdir(dirpath)
+                removed.add(dirpath)
+                self.logger.debug(f"Removed empty directory: {dirpath}")
             except OSError as e:
                 # Directory not empty or permission error
-                self.logger.debug(f"Could not remove directory {dir_path}: {e}")
+                self.logger.debug(f"Could not remove directory {dirpath}: {e}")
 
     def check_permissions(self) -> bool:
         """Check if we have necessary permissions for the operation."""
@@ -438,7 +789,7 @@ class FileExtensionOrganizer:
 
             # Try normal removal first
             try:
-                file_path.unlink()
+                os.unlink(file_path)
                 self.logger.info(f"Removed duplicate file: {file_path}")
                 return True
             except PermissionError as e:
@@ -463,7 +814,8 @@ class FileExtensionOrganizer:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
                 self.logger.info(f"Used sudo to remove duplicate file: {file_path}")
-                self.stats['sudo_used'] += 1
+                with self._lock:
+                    self.stats['sudo_used'] += 1
                 return True
             else:
                 self.logger.error(f"Sudo removal failed: {result.stderr}")
@@ -564,6 +916,22 @@ Examples:
         help='Method for detecting duplicates: size (fast), hash (thorough), both (size+hash)'
     )
 
+    parser.add_argument(
+        '--hash-algo',
+        choices=sorted(alg for alg in hashlib.algorithms_guaranteed if not alg.startswith('shake')) + sorted(XXHASH_ALGORITHMS),
+        default='blake2b',
+        help='Hash algorithm for hash-based duplicate detection (default: blake2b); '
+             'xxh3_64/xxh3_128 are much faster but need the xxhash package'
+    )
+
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=8,
+        help='Number of files to hash and move concurrently (default: 8, 1 = sequential); '
+             'above 1, which duplicate is kept and which file gets a _N suffix follows completion order'
+    )
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -580,6 +948,10 @@ Examples:
         print("Error: --remove-source-dupes requires --skip-duplicates to be enabled")
         return 1
 
+    if args.hash_algo in XXHASH_ALGORITHMS and xxhash is None:
+        print(f"Error: --hash-algo {args.hash_algo} requires the xxhash package (pip install xxhash)")
+        return 1
+
     # Validate source directory
     source_path = Path(args.source)
     if not source_path.exists():
@@ -601,9 +973,11 @@ Examples:
         args.max_files,
         args.batch_size,
         args.sudo,
-        args.skip_duplicates,
-        args.remove_source_dupes,
-        args.dedupe_method
+        skip_duplicates=args.skip_duplicates,
+        remove_source_dupes=args.remove_source_dupes,
+        dedupe_method=args.dedupe_method,
+        max_concurrency=args.max_concurrency,
+        hash_algo=args.hash_algo
     )
 
     # Check permissions and request sudo if needed
@@ -6,33 +6,108 @@ This script recursively finds MP3 and FLAC files, reads their ID3 tags,
 and organizes them into a logical directory structure: Artist/Album/Track.
 """
 
+import asyncio
 import os
-import shutil
-import re
+import pickle
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import argparse
 import logging
 
-try:
-    from mutagen.mp3 import MP3
-    from mutagen.flac import FLAC
-    from mutagen.id3 import ID3NoHeaderError
-    from mutagen import File as MutagenFile
-except ImportError:
-    print("Error: mutagen library not found. Please install with: pip install mutagen")
-    exit(1)
+from ._fileops import rename_or_move
+
+# Bound by _import_mutagen on first use, so importing this module (or starting
+# a pool worker) doesn't pay for mutagen until tags are actually read
+MutagenFile = None
+
+
+# Number of directories listed concurrently when searching for files
+WALK_WORKERS = 8
+
+# Moves in flight at once in the async organizers
+MOVE_CONCURRENCY = 32
+
+# Lowercased suffixes of the files we organize
+MUSIC_EXTENSIONS = frozenset({'.mp3', '.flac', '.ogg', '.m4a', '.wav', '.ape'})
+
+# Characters that are invalid in file names on common filesystems map to '_'
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+MAX_FILENAME_LENGTH = 200
+
+# Common tag mappings for different formats
+TAG_MAPPINGS = {
+    'artist': ['TPE1', 'ARTIST', 'albumartist', 'TPE2'],
+    'album': ['TALB', 'ALBUM'],
+    'title': ['TIT2', 'TITLE'],
+    'track': ['TRCK', 'TRACKNUMBER'],
+    'date': ['TDRC', 'DATE', 'YEAR'],
+    'genre': ['TCON', 'GENRE']
+}
+
+
+def _import_mutagen() -> None:
+    """Import mutagen once per process; also the process pool initializer."""
+    global MutagenFile
+    if MutagenFile is None:
+        from mutagen import File
+        MutagenFile = File
+
+
+def _read_tags(file_path: Path) -> Dict[str, str]:
+    """Read the tags we organize by from an audio file; raises on unreadable files."""
+    _import_mutagen()
+    audio_file = MutagenFile(file_path)
+    if audio_file is None:
+        return {}
+
+    metadata = {}
+    for key, possible_tags in TAG_MAPPINGS.items():
+        for tag in possible_tags:
+            if tag in audio_file:
+                value = audio_file[tag]
+                if isinstance(value, list) and value:
+                    metadata[key] = str(value[0])
+                else:
+                    metadata[key] = str(value)
+                break
+
+    return metadata
+
+
+def _extract_one(file_path: Path) -> Tuple[Dict[str, str], Optional[str]]:
+    """Process pool worker: returns (metadata, error message or None)."""
+    try:
+        return _read_tags(file_path), None
+    except Exception as e:
+        return {}, str(e)
 
 
 class MusicOrganizer:
     """Organizes music files based on their metadata tags."""
 
-    SUPPORTED_FORMATS = {'.mp3', '.flac', '.ogg', '.m4a', '.wav', '.ape'}
+    SUPPORTED_FORMATS = MUSIC_EXTENSIONS
 
-    def __init__(self, source_dir: str, target_dir: str, dry_run: bool = False):
+    def __init__(self, source_dir: str, target_dir: str, dry_run: bool = False,
+                 max_workers: Optional[int] = None, cache_path: Optional[str] = None,
+                 walk_workers: int = WALK_WORKERS):
         self.source_dir = Path(source_dir).resolve()
         self.target_dir = Path(target_dir).resolve()
         self.dry_run = dry_run
+        # Processes used to read tags; None means one per CPU
+        self.max_workers = max_workers
+        # Threads listing directories during the walk; 1 walks the tree serially
+        self.walk_workers = walk_workers
+        # Target directories already created, so each is only mkdir'ed once
+        self._created_dirs = set()
+        # Guards target name choice when files are moved concurrently
+        self._lock = threading.Lock()
+        self._reserved_targets = set()
+        # Next suffix number to try for each conflicting target name
+        self._next_suffix = {}
+        # Extraction results from earlier runs, keyed by (path, mtime_ns, size)
+        self.cache_path = Path(cache_path) if cache_path else None
         self.stats = {
             'processed': 0,
             'moved': 0,
@@ -47,52 +122,104 @@ class MusicOrganizer:
         )
         self.logger = logging.getLogger(__name__)
 
+        self._metadata_cache = self._load_cache() if self.cache_path else None
+
     def sanitize_filename(self, filename: str) -> str:
         """Remove or replace invalid characters for filesystem compatibility."""
-        # Replace problematic characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        # Replace problematic characters in one C-level pass
+        filename = filename.translate(_SANITIZE_TABLE)
         # Remove leading/trailing dots and spaces
         filename = filename.strip('. ')
         # Limit length
-        if len(filename) > 200:
-            filename = filename[:200]
-        return filename or "Unknown"
+        return filename[:MAX_FILENAME_LENGTH] or "Unknown"
 
     def extract_metadata(self, file_path: Path) -> Dict[str, str]:
         """Extract metadata from audio file."""
-        try:
-            audio_file = MutagenFile(file_path)
-            if audio_file is None:
-                return {}
-
-            metadata = {}
-
-            # Common tag mappings for different formats
-            tag_mappings = {
-                'artist': ['TPE1', 'ARTIST', 'albumartist', 'TPE2'],
-                'album': ['TALB', 'ALBUM'],
-                'title': ['TIT2', 'TITLE'],
-                'track': ['TRCK', 'TRACKNUMBER'],
-                'date': ['TDRC', 'DATE', 'YEAR'],
-                'genre': ['TCON', 'GENRE']
-            }
-
-            for key, possible_tags in tag_mappings.items():
-                for tag in possible_tags:
-                    if tag in audio_file:
-                        value = audio_file[tag]
-                        if isinstance(value, list) and value:
-                            metadata[key] = str(value[0])
-                        else:
-                            metadata[key] = str(value)
-                        break
-
-            return metadata
+        metadata, error = _extract_one(file_path)
+        if error is not None:
+            self.logger.warning(f"Error reading metadata from {file_path}: {error}")
+        return metadata
 
+    def _load_cache(self) -> Dict[Tuple[str, int, int], tuple]:
+        """Load extraction results saved by an earlier run, or start empty."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return {}
         except Exception as e:
-            self.logger.warning(f"Error reading metadata from {file_path}: {e}")
+            self.logger.warning(f"Ignoring unreadable cache {self.cache_path}: {e}")
             return {}
 
+    def save_cache(self) -> None:
+        """Write the extraction cache, replacing the old file only once the new one is complete."""
+        if self._metadata_cache is None:
+            return
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._metadata_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save cache {self.cache_path}: {e}")
+
+    @staticmethod
+    def _cache_key(file_path: Path) -> Optional[Tuple[str, int, int]]:
+        """Identify one version of a file; any edit changes its mtime or size."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return str(file_path), st.st_mtime_ns, st.st_size
+
+    def _extract_cached(self, files: List[Path]) -> Iterator[tuple]:
+        """Yield _extract_one's result for each file in order, only extracting files not cached."""
+        cache = self._metadata_cache
+        if cache is None:
+            yield from self._extract_results(files)
+            return
+
+        keys = [self._cache_key(file_path) for file_path in files]
+        fresh = self._extract_results([f for f, key in zip(files, keys) if key not in cache])
+        for key in keys:
+            if key in cache:
+                yield cache[key]
+                continue
+            result = next(fresh)
+            # Failed reads are retried next run rather than remembered
+            if key is not None and result[-1] is None:
+                cache[key] = result
+            yield result
+        fresh.close()
+
+        # Reached only once every result is consumed, hence zip(..., strict=True) in callers.
+        # Entries from other source trees are kept; under this one, drop files
+        # the walk no longer found and older versions of files it did find
+        seen = set(keys)
+        root = str(self.source_dir) + os.sep
+        self._metadata_cache = {key: value for key, value in cache.items()
+                                if key in seen or not key[0].startswith(root)}
+
+    def _extract_results(self, music_files: List[Path]) -> Iterator[Tuple[Dict[str, str], Optional[str]]]:
+        """Yield (metadata, error) for each file in order, reading tags on a process pool."""
+        if self.max_workers == 1 or len(music_files) < 2:
+            for file_path in music_files:
+                yield _extract_one(file_path)
+            return
+
+        # Tag parsing is CPU-bound, so it scales across processes
+        workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_import_mutagen) as executor:
+            chunksize = max(1, len(music_files) // (workers * 4))
+            yield from executor.map(_extract_one, music_files, chunksize=chunksize)
+
+    def _extract_all(self, music_files: List[Path]) -> Iterator[Dict[str, str]]:
+        """Yield the metadata of each file in order, reusing cached results for unchanged files."""
+        for file_path, (metadata, error) in zip(music_files, self._extract_cached(music_files), strict=True):
+            if error is not None:
+                self.logger.warning(f"Error reading metadata from {file_path}: {error}")
+            yield metadata
+
     def generate_target_path(self, file_path: Path, metadata: Dict[str, str]) -> Path:
         """Generate the target path based on metadata."""
         artist = metadata.get('artist', 'Unknown Artist')
@@ -123,15 +250,58 @@ class MusicOrganizer:
 
         return self.target_dir / artist / album / filename
 
+    def _scan_directory(self, path: str) -> Tuple[List[str], List[str]]:
+        """List one directory, returning (subdirectories, supported files)."""
+        subdirs = []
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Entry types come from the directory listing, so no extra stat()
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in MUSIC_EXTENSIONS:
+                        files.append(entry.path)
+        except OSError as e:
+            self.logger.warning(f"Cannot scan directory {path}: {e}")
+        # scandir order depends on the filesystem; sorting keeps collision suffixes stable across runs
+        subdirs.sort()
+        files.sort()
+        return subdirs, files
+
+    def _walk(self, listings: Optional[Dict[str, Tuple[List[str], List[str]]]] = None) -> Iterator[Path]:
+        """Yield supported files depth-first in sorted order, one directory at a time.
+
+        Directories already listed in ``listings`` are taken from it instead of being scanned again.
+        """
+        stack = [str(self.source_dir)]
+        while stack:
+            path = stack.pop()
+            subdirs, files = listings.pop(path) if listings is not None else self._scan_directory(path)
+            yield from map(Path, files)
+            # Reversed so subdirectories are visited in the order they were listed
+            stack.extend(reversed(subdirs))
+
     def find_music_files(self) -> List[Path]:
         """Recursively find all music files in source directory."""
-        music_files = []
+        if self.walk_workers <= 1:
+            return list(self._walk())
 
-        for file_path in self.source_dir.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                music_files.append(file_path)
+        listings = {}
 
-        return music_files
+        # Directories are listed concurrently: each scandir blocks on disk
+        # metadata, so several in flight hide the latency on large trees
+        with ThreadPoolExecutor(max_workers=self.walk_workers) as executor:
+            pending = {executor.submit(self._scan_directory, str(self.source_dir)): str(self.source_dir)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, files = future.result()
+                    listings[pending.pop(future)] = (subdirs, files)
+                    pending.update((executor.submit(self._scan_directory, d), d) for d in subdirs)
+
+        # Emit in the serial walk's order, not completion order, so repeated runs match
+        return list(self._walk(listings))
 
     def move_file(self, source: Path, target: Path) -> bool:
         """Move file to target location, creating directories as needed."""
@@ -141,22 +311,35 @@ class MusicOrganizer:
                 self.logger.info(f"DRY RUN: Would move {source} -> {target}")
                 return True
 
-            if target.exists():
-                # Handle duplicates by adding a number suffix
-                counter = 1
-                while target.exists():
-                    stem = target.stem
-                    suffix = target.suffix
-                    parent = target.parent
-                    target = parent / f"{stem}_{counter}{suffix}"
-                    counter += 1
+            # Pick a free name and reserve it, so concurrent moves can't choose the same one
+            with self._lock:
+                if target.exists() or target in self._reserved_targets:
+                    # Handle duplicates by adding a number suffix, resuming from
+                    # the last suffix used for this name instead of re-probing from 1
+                    base = target
+                    counter = self._next_suffix.get(base, 1)
+                    while True:
+                        target = base.parent / f"{base.stem}_{counter}{base.suffix}"
+                        if target not in self._reserved_targets and not target.exists():
+                            break
+                        counter += 1
+                    self._next_suffix[base] = counter + 1
 
-                self.logger.warning(f"Duplicate found, renaming to: {target.name}")
+                    self.logger.warning(f"Duplicate found, renaming to: {target.name}")
+
+                self._reserved_targets.add(target)
+
+            try:
+                # Create target directory only when not in dry run mode
+                if target.parent not in self._created_dirs:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(target.parent)
 
-            # Create target directory only when not in dry run mode
-            target.parent.mkdir(parents=True, exist_ok=True)
+                rename_or_move(source, target)
+            finally:
+                with self._lock:
+                    self._reserved_targets.discard(target)
 
-            shutil.move(str(source), str(target))
             self.logger.info(f"Moved: {source.name} -> {target}")
             return True
 
@@ -164,37 +347,73 @@ class MusicOrganizer:
             self.logger.error(f"Error moving {source} to {target}: {e}")
             return False
 
-    def organize_music(self) -> Dict[str, int]:
-        """Main method to organize all music files."""
+    def _start(self) -> List[Path]:
+        """Log the run settings and find the files to organize."""
         self.logger.info(f"Starting music organization...")
         self.logger.info(f"Source: {self.source_dir}")
         self.logger.info(f"Target: {self.target_dir}")
         self.logger.info(f"Dry run: {self.dry_run}")
 
+        # Fail fast if mutagen is missing; forked workers then inherit the import
+        _import_mutagen()
+
         music_files = self.find_music_files()
         self.logger.info(f"Found {len(music_files)} music files")
+        return music_files
 
-        for file_path in music_files:
+    def _plan_moves(self, music_files: List[Path]) -> Iterator[Tuple[Path, Path]]:
+        """Yield (source, target) for each file that can be organized, counting the rest."""
+        # Tags are read in parallel; targets are chosen in order
+        for file_path, metadata in zip(music_files, self._extract_all(music_files), strict=True):
             self.stats['processed'] += 1
 
             try:
-                metadata = self.extract_metadata(file_path)
                 target_path = self.generate_target_path(file_path, metadata)
-
-                if self.move_file(file_path, target_path):
-                    self.stats['moved'] += 1
-                else:
-                    self.stats['errors'] += 1
-
             except Exception as e:
                 self.logger.error(f"Error processing {file_path}: {e}")
                 self.stats['errors'] += 1
+                continue
 
+            yield file_path, target_path
+
+    def _finish(self) -> Dict[str, int]:
         self.logger.info("Organization complete!")
         self.logger.info(f"Statistics: {self.stats}")
 
         return self.stats
 
+    def organize_music(self) -> Dict[str, int]:
+        """Main method to organize all music files."""
+        music_files = self._start()
+
+        try:
+            for file_path, target_path in self._plan_moves(music_files):
+                if self.move_file(file_path, target_path):
+                    self.stats['moved'] += 1
+                else:
+                    self.stats['errors'] += 1
+        finally:
+            # Saved even when interrupted, so a restart skips what was already read
+            self.save_cache()
+
+        return self._finish()
+
+    async def organize_music_async(self, max_concurrency: int = MOVE_CONCURRENCY) -> Dict[str, int]:
+        """Organize all music files, running up to max_concurrency moves at once on threads."""
+        music_files = self._start()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def move_one(source: Path, target: Path) -> None:
+            async with semaphore:
+                moved = await asyncio.to_thread(self.move_file, source, target)
+            self.stats['moved' if moved else 'errors'] += 1
+
+        try:
+            await asyncio.gather(*(move_one(source, target) for source, target in self._plan_moves(music_files)))
+        finally:
+            self.save_cache()
+
+        return self._finish()
 
 def main():
     """Command line interface."""
@@ -219,9 +438,20 @@ def main():
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="Remember tags read in FILE, so a restarted run skips unchanged files"
+    )
 
     args = parser.parse_args()
 
+    try:
+        _import_mutagen()
+    except ImportError:
+        print("Error: mutagen library not found. Please install with: pip install mutagen")
+        return 1
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -232,7 +462,7 @@ def main():
         return 1
 
     # Create organizer and run
-    organizer = MusicOrganizer(args.source, args.target, args.dry_run)
+    organizer = MusicOrganizer(args.source, args.target, args.dry_run, cache_path=args.cache)
     stats = organizer.organize_music()
 
     # Print summary
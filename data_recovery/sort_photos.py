@@ -7,31 +7,140 @@ and organizes them into a logical directory structure: Year/Month/Date-Time_Orig
 Photos without EXIF date information are skipped.
 """
 
-import shutil
+import asyncio
+import os
+import pickle
 import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import argparse
 import logging
 from datetime import datetime
 
-try:
-    from PIL import Image
-    from PIL.ExifTags import TAGS
-except ImportError:
-    print("Error: Pillow library not found. Please install with: pip install Pillow")
-    exit(1)
+from ._fileops import rename_or_move
+
+# Bound by _import_pil on first use, so importing this module (or starting
+# a pool worker) doesn't pay for Pillow until EXIF is actually read
+Image = None
+TAGS = None
+
+
+# Number of directories listed concurrently when searching for files
+WALK_WORKERS = 8
+
+# Moves in flight at once in the async organizers
+MOVE_CONCURRENCY = 32
+
+# Lowercased suffixes of the files we organize
+PHOTO_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.tiff', '.tif', '.png', '.bmp', '.gif', '.webp', '.heic', '.heif', '.raw', '.cr2', '.nef', '.arw', '.dng'})
+
+# Characters that are invalid in file names on common filesystems map to '_'
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+MAX_FILENAME_LENGTH = 200
+
+# EXIF tags holding the date a photo was taken
+DATE_TAGS = ['DateTime', 'DateTimeOriginal', 'DateTimeDigitized']
+
+
+def _import_pil() -> None:
+    """Import Pillow once per process; also the process pool initializer."""
+    global Image, TAGS
+    if Image is None:
+        from PIL import Image as pil_image
+        Image = pil_image
+    if TAGS is None:
+        from PIL.ExifTags import TAGS as exif_tags
+        TAGS = exif_tags
+
+
+def _read_exif(file_path: Path) -> Optional[dict]:
+    """Read the raw EXIF dictionary of an image; raises on unreadable files."""
+    _import_pil()
+    with Image.open(file_path) as image:
+        return image._getexif()
+
+
+# EXIF date strings, parsed with one regex rather than trying strptime formats in turn
+_EXIF_DATE_RE = re.compile(r'(\d{4})[:\-](\d{2})[:\-](\d{2})[ T](\d{2}):(\d{2}):(\d{2})')
+
+
+def _parse_exif_date(exif_data: Optional[dict]) -> Optional[datetime]:
+    """Find and parse the date taken in raw EXIF data."""
+    if exif_data is None:
+        return None
+    for tag_id, value in exif_data.items():
+        clean_value = value.strip().strip('\x00') if isinstance(value, str) else value
+        tag_name = TAGS.get(tag_id, tag_id)
+        if tag_name in DATE_TAGS:
+            # Parse the date string (format: "YYYY:MM:DD HH:MM:SS" or "YYYY-MM-DD HH:MM:SS")
+            match = _EXIF_DATE_RE.fullmatch(clean_value)
+            if match is None:
+                continue
+            try:
+                return datetime(*map(int, match.groups()))
+            except ValueError:
+                # Well-formed but out of range, e.g. "0000:00:00 00:00:00"
+                continue
+    return None
+
+
+def _parse_exif_make(exif_data: Optional[dict]) -> str:
+    """Find the camera Make in raw EXIF data, or 'Unknown'."""
+    if exif_data is None:
+        return "Unknown"
+    for tag_id, value in exif_data.items():
+        tag_name = TAGS.get(tag_id, tag_id)
+        if tag_name == "Make":
+            return str(value).strip() or "Unknown"
+    return "Unknown"
+
+
+def _extract_one(file_path: Path) -> Tuple[Optional[datetime], str, Optional[str]]:
+    """
+    Process pool worker: open the image once and return
+    (date taken, camera make, error message or None).
+
+    The make is only looked up when there is no date, as that's the only time
+    it is used.
+    """
+    try:
+        exif_data = _read_exif(file_path)
+        date_taken = _parse_exif_date(exif_data)
+    except Exception as e:
+        return None, "Unknown", str(e)
+    try:
+        make = _parse_exif_make(exif_data) if date_taken is None else "Unknown"
+    except Exception:
+        make = "Unknown"
+    return date_taken, make, None
 
 
 class PhotoOrganizer:
     """Organizes photo files based on their EXIF metadata."""
 
-    SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.tiff', '.tif', '.png', '.bmp', '.gif', '.webp', '.heic', '.heif', '.raw', '.cr2', '.nef', '.arw', '.dng'}
+    SUPPORTED_FORMATS = PHOTO_EXTENSIONS
 
-    def __init__(self, source_dir: str, target_dir: str, dry_run: bool = False):
+    def __init__(self, source_dir: str, target_dir: str, dry_run: bool = False,
+                 max_workers: Optional[int] = None, cache_path: Optional[str] = None,
+                 walk_workers: int = WALK_WORKERS):
         self.source_dir = Path(source_dir).resolve()
         self.target_dir = Path(target_dir).resolve()
         self.dry_run = dry_run
+        # Processes used to read EXIF data; None means one per CPU
+        self.max_workers = max_workers
+        # Threads listing directories during the walk; 1 walks the tree serially
+        self.walk_workers = walk_workers
+        # Target directories already created, so each is only mkdir'ed once
+        self._created_dirs = set()
+        # Guards target name choice when files are moved concurrently
+        self._lock = threading.Lock()
+        self._reserved_targets = set()
+        # Next suffix number to try for each conflicting target name
+        self._next_suffix = {}
+        # Extraction results from earlier runs, keyed by (path, mtime_ns, size)
+        self.cache_path = Path(cache_path) if cache_path else None
         self.stats = {
             'processed': 0,
             'moved': 0,
@@ -46,41 +155,22 @@ class PhotoOrganizer:
         )
         self.logger = logging.getLogger(__name__)
 
+        self._metadata_cache = self._load_cache() if self.cache_path else None
+
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Remove or replace invalid characters for filesystem compatibility."""
-        # Replace problematic characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        # Replace problematic characters in one C-level pass
+        filename = filename.translate(_SANITIZE_TABLE)
         # Remove leading/trailing dots and spaces
         filename = filename.strip('. ')
         # Limit length
-        if len(filename) > 200:
-            filename = filename[:200]
-        return filename or "Unknown"
+        return filename[:MAX_FILENAME_LENGTH] or "Unknown"
 
     def extract_exif_date(self, file_path: Path) -> tuple[Optional[datetime], bool]:
         """Extract date taken from EXIF data. Returns (date, had_error)."""
         try:
-            with Image.open(file_path) as image:
-                exif_data = image._getexif()
-                if exif_data is None:
-                    return None, False
-                # Look for date taken tags
-                date_tags = ['DateTime', 'DateTimeOriginal', 'DateTimeDigitized']
-                for tag_id, value in exif_data.items():
-                    clean_value = value.strip().strip('\x00') if isinstance(value, str) else value
-                    tag_name = TAGS.get(tag_id, tag_id)
-                    if tag_name in date_tags:
-                        try:
-                            # Parse the date string (format: "YYYY:MM:DD HH:MM:SS")
-                            return datetime.strptime(clean_value, "%Y:%m:%d %H:%M:%S"), False
-                        except ValueError:
-                            # Try alternative format
-                            try:
-                                return datetime.strptime(clean_value, "%Y-%m-%d %H:%M:%S"), False
-                            except ValueError:
-                                continue
-                return None, False
+            return _parse_exif_date(_read_exif(file_path)), False
         except Exception as e:
             self.logger.warning(f"Error reading EXIF from {file_path}: {e}")
             return None, True
@@ -88,17 +178,86 @@ class PhotoOrganizer:
     def extract_exif_make(self, file_path: Path) -> str:
         """Extract camera Make from EXIF data, or return 'Unknown' if not found."""
         try:
-            with Image.open(file_path) as image:
-                exif_data = image._getexif()
-                if exif_data is None:
-                    return "Unknown"
-                for tag_id, value in exif_data.items():
-                    tag_name = TAGS.get(tag_id, tag_id)
-                    if tag_name == "Make":
-                        return str(value).strip() or "Unknown"
+            return _parse_exif_make(_read_exif(file_path))
         except Exception:
-            pass
-        return "Unknown"
+            return "Unknown"
+
+    def _load_cache(self) -> Dict[Tuple[str, int, int], tuple]:
+        """Load extraction results saved by an earlier run, or start empty."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {self.cache_path}: {e}")
+            return {}
+
+    def save_cache(self) -> None:
+        """Write the extraction cache, replacing the old file only once the new one is complete."""
+        if self._metadata_cache is None:
+            return
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._metadata_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save cache {self.cache_path}: {e}")
+
+    @staticmethod
+    def _cache_key(file_path: Path) -> Optional[Tuple[str, int, int]]:
+        """Identify one version of a file; any edit changes its mtime or size."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return str(file_path), st.st_mtime_ns, st.st_size
+
+    def _extract_cached(self, files: List[Path]) -> Iterator[tuple]:
+        """Yield _extract_one's result for each file in order, only extracting files not cached."""
+        cache = self._metadata_cache
+        if cache is None:
+            yield from self._extract_results(files)
+            return
+
+        keys = [self._cache_key(file_path) for file_path in files]
+        fresh = self._extract_results([f for f, key in zip(files, keys) if key not in cache])
+        for key in keys:
+            if key in cache:
+                yield cache[key]
+                continue
+            result = next(fresh)
+            # Failed reads are retried next run rather than remembered
+            if key is not None and result[-1] is None:
+                cache[key] = result
+            yield result
+        fresh.close()
+
+        # Reached only once every result is consumed, hence zip(..., strict=True) in callers.
+        # Entries from other source trees are kept; under this one, drop files
+        # the walk no longer found and older versions of files it did find
+        seen = set(keys)
+        root = str(self.source_dir) + os.sep
+        self._metadata_cache = {key: value for key, value in cache.items()
+                                if key in seen or not key[0].startswith(root)}
+
+    def _extract_results(self, photo_files: List[Path]) -> Iterator[Tuple[Optional[datetime], str, Optional[str]]]:
+        """Yield (date, make, error) for each file in order, reading EXIF on a process pool."""
+        if self.max_workers == 1 or len(photo_files) < 2:
+            for file_path in photo_files:
+                yield _extract_one(file_path)
+            return
+
+        # EXIF decoding is CPU-bound, so it scales across processes
+        workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_import_pil) as executor:
+            chunksize = max(1, len(photo_files) // (workers * 4))
+            yield from executor.map(_extract_one, photo_files, chunksize=chunksize)
+
+    def _extract_all(self, photo_files: List[Path]) -> Iterator[Tuple[Optional[datetime], str, Optional[str]]]:
+        """Yield (date, make, error) for each file in order, reusing cached results for unchanged files."""
+        return self._extract_cached(photo_files)
 
     def generate_target_path(self, file_path: Path, date_taken: datetime) -> Path:
         """Generate the target path based on date taken."""
@@ -118,15 +277,58 @@ class PhotoOrganizer:
 
         return self.target_dir / year / month / filename
 
+    def _scan_directory(self, path: str) -> Tuple[List[str], List[str]]:
+        """List one directory, returning (subdirectories, supported files)."""
+        subdirs = []
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Entry types come from the directory listing, so no extra stat()
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in PHOTO_EXTENSIONS:
+                        files.append(entry.path)
+        except OSError as e:
+            self.logger.warning(f"Cannot scan directory {path}: {e}")
+        # scandir order depends on the filesystem; sorting keeps collision suffixes stable across runs
+        subdirs.sort()
+        files.sort()
+        return subdirs, files
+
+    def _walk(self, listings: Optional[Dict[str, Tuple[List[str], List[str]]]] = None) -> Iterator[Path]:
+        """Yield supported files depth-first in sorted order, one directory at a time.
+
+        Directories already listed in ``listings`` are taken from it instead of being scanned again.
+        """
+        stack = [str(self.source_dir)]
+        while stack:
+            path = stack.pop()
+            subdirs, files = listings.pop(path) if listings is not None else self._scan_directory(path)
+            yield from map(Path, files)
+            # Reversed so subdirectories are visited in the order they were listed
+            stack.extend(reversed(subdirs))
+
     def find_photo_files(self) -> List[Path]:
         """Recursively find all photo files in source directory."""
-        photo_files = []
+        if self.walk_workers <= 1:
+            return list(self._walk())
 
-        for file_path in self.source_dir.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                photo_files.append(file_path)
+        listings = {}
 
-        return photo_files
+        # Directories are listed concurrently: each scandir blocks on disk
+        # metadata, so several in flight hide the latency on large trees
+        with ThreadPoolExecutor(max_workers=self.walk_workers) as executor:
+            pending = {executor.submit(self._scan_directory, str(self.source_dir)): str(self.source_dir)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, files = future.result()
+                    listings[pending.pop(future)] = (subdirs, files)
+                    pending.update((executor.submit(self._scan_directory, d), d) for d in subdirs)
+
+        # Emit in the serial walk's order, not completion order, so repeated runs match
+        return list(self._walk(listings))
 
     def move_file(self, source: Path, target: Path) -> bool:
         """Move file to target location, creating directories as needed."""
@@ -136,22 +338,35 @@ class PhotoOrganizer:
                 self.logger.info(f"DRY RUN: Would move {source} -> {target}")
                 return True
 
-            if target.exists():
-                # Handle duplicates by adding a number suffix
-                counter = 1
-                while target.exists():
-                    stem = target.stem
-                    suffix = target.suffix
-                    parent = target.parent
-                    target = parent / f"{stem}_{counter}{suffix}"
-                    counter += 1
-
-                self.logger.warning(f"Duplicate found, renaming to: {target.name}")
-
-            # Create target directory only when not in dry run mode
-            target.parent.mkdir(parents=True, exist_ok=True)
+            # Pick a free name and reserve it, so concurrent moves can't choose the same one
+            with self._lock:
+                if target.exists() or target in self._reserved_targets:
+                    # Handle duplicates by adding a number suffix, resuming from
+                    # the last suffix used for this name instead of re-probing from 1
+                    base = target
+                    counter = self._next_suffix.get(base, 1)
+                    while True:
+                        target = base.parent / f"{base.stem}_{counter}{base.suffix}"
+                        if target not in self._reserved_targets and not target.exists():
+                            break
+                        counter += 1
+                    self._next_suffix[base] = counter + 1
+
+                    self.logger.warning(f"Duplicate found, renaming to: {target.name}")
+
+                self._reserved_targets.add(target)
+
+            try:
+                # Create target directory only when not in dry run mode
+                if target.parent not in self._created_dirs:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(target.parent)
+
+                rename_or_move(source, target)
+            finally:
+                with self._lock:
+                    self._reserved_targets.discard(target)
 
-            shutil.move(str(source), str(target))
             self.logger.info(f"Moved: {source.name} -> {target}")
             return True
 
@@ -159,49 +374,80 @@ class PhotoOrganizer:
             self.logger.error(f"Error moving {source} to {target}: {e}")
             return False
 
-    def organize_photos(self) -> Dict[str, int]:
-        """Main method to organize all photo files."""
+    def _start(self) -> List[Path]:
+        """Log the run settings and find the files to organize."""
         self.logger.info(f"Starting photo organization...")
         self.logger.info(f"Source: {self.source_dir}")
         self.logger.info(f"Target: {self.target_dir}")
         self.logger.info(f"Dry run: {self.dry_run}")
 
+        # Fail fast if Pillow is missing; forked workers then inherit the import
+        _import_pil()
+
         photo_files = self.find_photo_files()
         self.logger.info(f"Found {len(photo_files)} photo files")
+        return photo_files
 
-        for file_path in photo_files:
+    def _plan_moves(self, photo_files: List[Path]) -> Iterator[Tuple[Path, Path]]:
+        """Yield (source, target) for each photo that can be organized, counting the rest."""
+        # EXIF is read in parallel; targets are chosen in order
+        for file_path, (date_taken, make, error) in zip(photo_files, self._extract_all(photo_files), strict=True):
             self.stats['processed'] += 1
-            date_taken, had_error = self.extract_exif_date(file_path)
-            if had_error:
+            if error is not None:
+                self.logger.warning(f"Error reading EXIF from {file_path}: {error}")
                 self.logger.info(f"Error processing {file_path.name} - could not extract EXIF date")
                 self.stats['errors'] += 1
                 continue
             if date_taken is None:
                 # Try to sort by Make if no EXIF date
-                make = self.extract_exif_make(file_path)
                 if make == "Unknown":
                     self.logger.info(f"Skipping {file_path.name} - no EXIF date or Make found")
                     self.stats['skipped'] += 1
                     continue
                 # Place in Make subdirectory
-                target_path = self.target_dir / "by_make" / make / file_path.name
-                if self.move_file(file_path, target_path):
-                    self.stats['moved'] += 1
-                else:
-                    self.stats['errors'] += 1
+                yield file_path, self.target_dir / "by_make" / make / file_path.name
                 continue
-            target_path = self.generate_target_path(file_path, date_taken)
-            if self.move_file(file_path, target_path):
-                self.stats['moved'] += 1
-            else:
-                self.stats['errors'] += 1
+            yield file_path, self.generate_target_path(file_path, date_taken)
+
+    def _finish(self) -> Dict[str, int]:
         self.logger.info("Organization complete!")
         self.logger.info(f"Statistics: {self.stats}")
         return self.stats
 
+    def organize_photos(self) -> Dict[str, int]:
+        """Main method to organize all photo files."""
+        photo_files = self._start()
+        try:
+            for file_path, target_path in self._plan_moves(photo_files):
+                if self.move_file(file_path, target_path):
+                    self.stats['moved'] += 1
+                else:
+                    self.stats['errors'] += 1
+        finally:
+            # Saved even when interrupted, so a restart skips what was already read
+            self.save_cache()
+        return self._finish()
+
+    async def organize_photos_async(self, max_concurrency: int = MOVE_CONCURRENCY) -> Dict[str, int]:
+        """Organize all photo files, running up to max_concurrency moves at once on threads."""
+        photo_files = self._start()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def move_one(source: Path, target: Path) -> None:
+            async with semaphore:
+                moved = await asyncio.to_thread(self.move_file, source, target)
+            self.stats['moved' if moved else 'errors'] += 1
+
+        try:
+            await asyncio.gather(*(move_one(source, target) for source, target in self._plan_moves(photo_files)))
+        finally:
+            self.save_cache()
+        return self._finish()
+
     @staticmethod
     def print_exif_data(file_path: Path):
         """Print all EXIF data for a given image file."""
+        _import_pil()
         try:
             with Image.open(file_path) as image:
                 exif_data = image._getexif()
@@ -217,8 +463,7 @@ class PhotoOrganizer:
     @staticmethod
     def write_exif_for_directory(dir_path: Path, output_file: Path):
         """Loop through all files in dir_path, append EXIF data to output_file in readable format."""
-        from PIL import Image
-        from PIL.ExifTags import TAGS
+        _import_pil()
         with open(output_file, 'w', encoding='utf-8') as out:
             for file_path in sorted(dir_path.iterdir()):
                 if not file_path.is_file():
@@ -273,6 +518,12 @@ Examples:
         help='Enable verbose logging'
     )
 
+    parser.add_argument(
+        '--cache',
+        metavar='FILE',
+        help='Remember EXIF data read in FILE, so a restarted run skips unchanged files'
+    )
+
     parser.add_argument(
         '--exif',
         metavar='FILE',
@@ -288,6 +539,12 @@ Examples:
 
     args = parser.parse_args()
 
+    try:
+        _import_pil()
+    except ImportError:
+        print("Error: Pillow library not found. Please install with: pip install Pillow")
+        return 1
+
     # Set logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -319,7 +576,8 @@ Examples:
     organizer = PhotoOrganizer(
         source_dir=args.source_dir,
         target_dir=args.target_dir,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        cache_path=args.cache
     )
 
     try:
@@ -7,6 +7,7 @@ and organizes them into a logical directory structure: Year/Month/Date-Time_Orig
 Videos without creation date information are organized by file modification date.
 """
 
+import os
 import shutil
 import re
 import json
@@ -18,10 +19,14 @@ import logging
 from datetime import datetime
 
 
+# Lowercased suffixes of the files we organize
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.mpg', '.mpeg', '.m2v', '.asf', '.ts', '.mts', '.m2ts'})
+
+
 class VideoOrganizer:
     """Organizes video files based on their metadata."""
 
-    SUPPORTED_FORMATS = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.mpg', '.mpeg', '.m2v', '.asf', '.ts', '.mts', '.m2ts'}
+    SUPPORTED_FORMATS = VIDEO_EXTENSIONS
 
     def __init__(self, source_dir: str, target_dir: str, dry_run: bool = False):
         self.source_dir = Path(source_dir).resolve()
@@ -149,9 +154,19 @@ class VideoOrganizer:
         """Recursively find all video files in source directory."""
         video_files = []
 
-        for file_path in self.source_dir.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                video_files.append(file_path)
+        # scandir entries carry their type from the directory listing, so
+        # the extension filter runs before anything would need a stat()
+        stack = [str(self.source_dir)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in self.SUPPORTED_FORMATS and entry.is_file():
+                            video_files.append(Path(entry.path))
+            except OSError as e:
+                self.logger.warning(f"Cannot scan directory: {e}")
 
         return video_files
 
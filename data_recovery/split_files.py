@@ -14,6 +14,8 @@ import argparse
 import logging
 from collections import defaultdict
 
+from ._fileops import rename_or_move
+
 
 class FileSplitter:
     """Split files from a source directory into size-limited subdirectories."""
@@ -46,26 +48,33 @@ class FileSplitter:
             self.logger.error(f"Error getting size for {file_path}: {e}")
             return 0
 
-    def scan_directory(self, source_dir: Path) -> List[Tuple[Path, int]]:
+    def scan_directory(self, source_dir: Path, scandir_fn=os.scandir) -> List[Tuple[Path, int]]:
         """
         Scan directory and return list of (file_path, file_size) tuples.
 
         Args:
             source_dir: Path to the source directory
+            scandir_fn: Directory lister with the os.scandir interface
 
         Returns:
             List of tuples containing file path and size
         """
         files = []
-        if not source_dir.exists() or not source_dir.is_dir():
+        try:
+            with scandir_fn(source_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    try:
+                        size = entry.stat().st_size
+                    except OSError as e:
+                        self.logger.error(f"Error getting size for {entry.path}: {e}")
+                        continue
+                    if size > 0:  # Only include files with valid size
+                        files.append((Path(entry.path), size))
+        except (FileNotFoundError, NotADirectoryError):
             raise ValueError(f"Source directory does not exist or is not a directory: {source_dir}")
 
-        for file_path in source_dir.iterdir():
-            if file_path.is_file():
-                size = self.get_file_size(file_path)
-                if size > 0:  # Only include files with valid size
-                    files.append((file_path, size))
-
         # Sort by size (largest first) for better packing
         files.sort(key=lambda x: x[1], reverse=True)
         return files
@@ -174,7 +183,7 @@ class FileSplitter:
                     self.logger.info(f"  [DRY RUN] Would move: {file_path} -> {destination}")
                 else:
                     try:
-                        shutil.move(str(file_path), str(destination))
+                        rename_or_move(file_path, destination)
                         self.logger.info(f"  Moved: {file_path.name} -> {destination}")
                     except (OSError, shutil.Error) as e:
                         self.logger.error(f"  Error moving {file_path} to {destination}: {e}")
@@ -268,7 +277,7 @@ class FileSplitter:
                             self.logger.info(f"  [DRY RUN] Would move: {file_path} -> {destination}")
                         else:
                             try:
-                                shutil.move(str(file_path), str(destination))
+                                rename_or_move(file_path, destination)
                                 self.logger.info(f"  Moved: {file_path.name} -> {destination}")
                                 moved += 1
                             except (OSError, shutil.Error) as e:
@@ -4,6 +4,7 @@ Demonstration script for the deduplication functionality.
 Shows how to find and remove duplicate photos across batch directories.
 """
 
+import os
 import tempfile
 import shutil
 from pathlib import Path
@@ -11,6 +12,12 @@ from data_recovery.deduplicate import FileDuplicateRemover
 import hashlib
 
 
+def count_files(directory: Path, suffix: str = "") -> int:
+    """Count files ending in suffix, without building a list."""
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.name.endswith(suffix) and entry.is_file())
+
+
 def create_demo_photos(demo_dir: Path) -> None:
     """Create sample photo files with some duplicates."""
     print("Creating demo photo files...")
@@ -57,7 +64,7 @@ def create_demo_photos(demo_dir: Path) -> None:
     (batch3_dir / "cityscape.jpg").write_bytes(b"urban cityscape photo content")
     print(f"  Created batch_003/ with 3 duplicates + 1 new photo")
     
-    print(f"\nTotal files created: {sum(len(list(d.glob('*'))) for d in [batch1_dir, batch2_dir, batch3_dir])}")
+    print(f"\nTotal files created: {sum(count_files(d) for d in [batch1_dir, batch2_dir, batch3_dir])}")
 
 
 def demonstrate_basic_deduplication(demo_dir: Path) -> None:
@@ -153,7 +160,7 @@ def demonstrate_actual_removal(demo_dir: Path) -> None:
     shutil.copytree(demo_dir, removal_dir, ignore=shutil.ignore_patterns("test_*", "duplicate_report.txt"))
     
     print("Before removal:")
-    total_before = sum(len(list(d.glob("*.jpg"))) for d in removal_dir.glob("batch_*"))
+    total_before = sum(count_files(d, ".jpg") for d in removal_dir.glob("batch_*"))
     print(f"Total photos: {total_before}")
     
     # Actually remove duplicates
@@ -163,7 +170,7 @@ def demonstrate_actual_removal(demo_dir: Path) -> None:
     deduplicator.remove_duplicates(duplicates, keep_strategy="shortest_path")
     
     print("\nAfter removal:")
-    total_after = sum(len(list(d.glob("*.jpg"))) for d in removal_dir.glob("batch_*"))
+    total_after = sum(count_files(d, ".jpg") for d in removal_dir.glob("batch_*"))
     print(f"Total photos: {total_after}")
     print(f"Duplicates removed: {total_before - total_after}")
     
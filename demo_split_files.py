@@ -4,12 +4,19 @@ Demonstration script for the FileSplitter functionality.
 Creates sample files and shows how the splitter works with duplicate handling.
 """
 
+import os
 import tempfile
 import shutil
 from pathlib import Path
 from data_recovery.split_files import FileSplitter
 
 
+def count_entries(directory: Path, prefix: str = "") -> int:
+    """Count directory entries whose name starts with prefix, without building a list."""
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.name.startswith(prefix))
+
+
 def create_demo_files(demo_dir: Path) -> None:
     """Create sample files for demonstration."""
     print("Creating demo files...")
@@ -104,8 +111,8 @@ def main():
         dry_splitter = FileSplitter(max_size_gb=1.0, dry_run=True)
         dry_splitter.split_directory(source_dir, output_dir)
 
-        print(f"\nFiles still in source after dry run: {len(list(source_dir.glob('*')))}")
-        print(f"Directories created in output: {len(list(output_dir.glob('batch_*')))}")
+        print(f"\nFiles still in source after dry run: {count_entries(source_dir)}")
+        print(f"Directories created in output: {count_entries(output_dir, 'batch_')}")
 
         # Clean up for actual run
         shutil.rmtree(output_dir)
@@ -122,12 +129,18 @@ def main():
         print(f"Created {len(batch_dirs)} subdirectories:")
 
         for batch_dir in batch_dirs:
-            files_in_batch = list(batch_dir.glob("*"))
-            total_size = sum(f.stat().st_size for f in files_in_batch) / (1024**3)
-            print(f"\n{batch_dir.name}: {len(files_in_batch)} files, {total_size:.2f} GB")
-            for file_path in sorted(files_in_batch):
-                file_size = file_path.stat().st_size / (1024**2)
-                print(f"  {file_path.name} ({file_size:.0f} MB)")
+            # One scandir pass collects names and sizes together
+            files_in_batch = []
+            total_bytes = 0
+            with os.scandir(batch_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        size = entry.stat().st_size
+                        total_bytes += size
+                        files_in_batch.append((entry.name, size))
+            print(f"\n{batch_dir.name}: {len(files_in_batch)} files, {total_bytes / (1024**3):.2f} GB")
+            for name, size in sorted(files_in_batch):
+                print(f"  {name} ({size / (1024**2):.0f} MB)")
 
         # Reset for duplicate demo
         shutil.rmtree(source_dir)
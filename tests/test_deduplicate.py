@@ -67,6 +67,83 @@ class TestFileDuplicateRemover(unittest.TestCase):
             expected_hash = hashlib.new(algorithm, content).hexdigest()
             self.assertEqual(calculated_hash, expected_hash)
     
+    def test_calculate_file_hash_non_guaranteed_algorithm(self):
+        """Test algorithms only reachable through hashlib.new."""
+        content = b"Test content for hashing"
+        file_path = self.create_test_file("test.txt", content)
+        
+        if "sha512_256" not in hashlib.algorithms_available:
+            self.skipTest("sha512_256 not available")
+        
+        dedup = FileDuplicateRemover(hash_algorithm="sha512_256")
+        self.assertEqual(dedup.calculate_file_hash(file_path),
+                         hashlib.new("sha512_256", content).hexdigest())
+    
+    def test_calculate_file_hash_xxh3(self):
+        """Test the optional xxhash algorithms."""
+        try:
+            import xxhash
+        except ImportError:
+            self.skipTest("xxhash not installed")
+        
+        content = b"Test content for hashing" * 1000
+        file_path = self.create_test_file("test.txt", content)
+        
+        for algorithm in ["xxh3_64", "xxh3_128"]:
+            dedup = FileDuplicateRemover(hash_algorithm=algorithm)
+            calculated_hash = dedup.calculate_file_hash(file_path, chunk_size=1000)
+            self.assertEqual(calculated_hash, getattr(xxhash, algorithm)(content).hexdigest())
+    
+    def test_calculate_file_hash_multiple_algorithms(self):
+        """Test computing several digests in a single pass."""
+        content = b"Test content for hashing" * 1000
+        file_path = self.create_test_file("test.txt", content)
+    
+        dedup = FileDuplicateRemover(hash_algorithm=["sha256", "md5"])
+        calculated = dedup.calculate_file_hash(file_path, chunk_size=1024)
+    
+        self.assertEqual(calculated, {
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "md5": hashlib.md5(content).hexdigest(),
+        })
+    
+    def test_multiple_algorithms_share_pool_and_buffer(self):
+        """Test that large and small files reuse one hashing pool and one read buffer."""
+        large = b"large" * 1000
+        small = b"small"
+        large_path = self.create_test_file("large.bin", large)
+        small_path = self.create_test_file("small.bin", small)
+        
+        dedup = FileDuplicateRemover(hash_algorithm=["sha256", "md5"])
+        self.addCleanup(dedup.close)
+        with patch('data_recovery.deduplicate.MULTI_HASH_THREAD_THRESHOLD', 1000):
+            dedup.calculate_file_hash(large_path)
+            pool = dedup._digest_pool
+            buffer = dedup._local.buffer
+            self.assertEqual(dedup.calculate_file_hash(small_path)["md5"], hashlib.md5(small).hexdigest())
+            self.assertEqual(dedup.calculate_file_hash(large_path)["sha256"], hashlib.sha256(large).hexdigest())
+        
+        self.assertIsNotNone(pool)
+        self.assertIs(dedup._digest_pool, pool)
+        self.assertIs(dedup._local.buffer, buffer)
+        
+        dedup.close()
+        self.assertIsNone(dedup._digest_pool)
+    
+    def test_scan_directory_multiple_algorithms(self):
+        """Test duplicate detection when several digests are combined."""
+        self.create_test_file("dup1.txt", b"same")
+        self.create_test_file("dup2.txt", b"same")
+        self.create_test_file("unique.txt", b"different")
+    
+        dedup = FileDuplicateRemover(hash_algorithm=["sha256", "sha1"])
+        dedup.scan_directory(self.test_dir)
+    
+        duplicates = dedup.find_duplicates()
+        self.assertEqual(len(duplicates), 1)
+        expected_key = hashlib.sha256(b"same").hexdigest() + hashlib.sha1(b"same").hexdigest()
+        self.assertIn(expected_key, duplicates)
+    
     def test_calculate_file_hash_nonexistent(self):
         """Test hash calculation for nonexistent file."""
         nonexistent = self.test_dir / "nonexistent.txt"
@@ -138,6 +215,129 @@ class TestFileDuplicateRemover(unittest.TestCase):
         
         self.assertEqual(self.deduplicator.processed_files, 1)  # Only top-level file
     
+    def test_scan_directory_spills_to_disk(self):
+        """Test that large scans use the on-disk database and skip unique sizes."""
+        same_content = b"duplicate content"
+        dup1 = self.create_test_file("dup1.txt", same_content)
+        dup2 = self.create_test_file("subdir/dup2.txt", same_content)
+        self.create_test_file("same_size.txt", b"x" * len(same_content))
+        for i in range(10):
+            self.create_test_file(f"unique_size{i}.txt", b"u" * i)
+        
+        dedup = FileDuplicateRemover(spill_threshold=2)
+        dedup.scan_directory(self.test_dir)
+        
+        # At most 3 files are hashed before spilling, then only files sharing
+        # a size; nothing is kept in memory
+        self.assertLessEqual(dedup.processed_files, 6)
+        self.assertEqual(len(dedup.file_hashes), 0)
+        
+        duplicates = dedup.find_duplicates()
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual(set(list(duplicates.values())[0]), {dup1, dup2})
+        self.assertEqual(dedup.duplicates_found, 1)
+        
+        # The hash database can still be saved and reloaded
+        db_file = self.test_dir / "hashes.json"
+        dedup.save_hash_database(db_file)
+        new_dedup = FileDuplicateRemover()
+        new_dedup.load_hash_database(db_file)
+        self.assertEqual(new_dedup.find_duplicates(), duplicates)
+    
+    @unittest.skipIf(not hasattr(os, "symlink"), "symlinks not supported")
+    def test_scan_directory_does_not_follow_directory_symlinks(self):
+        """Test that symlinked directories are not walked (matching rglob)."""
+        self.create_test_file("real/file.txt", b"content")
+        os.symlink(self.test_dir / "real", self.test_dir / "link")
+        
+        self.deduplicator.scan_directory(self.test_dir)
+        
+        self.assertEqual(self.deduplicator.processed_files, 1)
+        paths = [p for paths in self.deduplicator.file_hashes.values() for p in paths]
+        self.assertEqual(paths, [self.test_dir / "real" / "file.txt"])
+    
+    def test_scan_and_group_threaded(self):
+        """Test the fused scan with hashing threads."""
+        same_content = b"duplicate content"
+        for i in range(10):
+            self.create_test_file(f"dir{i % 3}/dup{i}.txt", same_content)
+            self.create_test_file(f"dir{i % 3}/unique{i}.txt", f"unique {i}".encode())
+        
+        dedup = FileDuplicateRemover(hash_threads=4)
+        dedup.scan_and_group(self.test_dir)
+        
+        self.assertEqual(dedup.processed_files, 20)
+        self.assertEqual(dedup.total_files, 20)
+        self.assertEqual(len(dedup.file_hashes), 11)
+        self.assertEqual(len(dedup.file_hashes[hashlib.sha256(same_content).hexdigest()]), 10)
+    
+    def test_scan_and_group_spills_mid_scan(self):
+        """Test handing over to the on-disk database part-way through a scan."""
+        same_content = b"duplicate content"
+        for i in range(300):
+            self.create_test_file(f"file{i:03d}.txt", f"{i:017d}".encode())
+        dups = [self.create_test_file(f"dup{i}.txt", same_content) for i in range(2)]
+        
+        dedup = FileDuplicateRemover(spill_threshold=100)
+        dedup.scan_and_group(self.test_dir)
+        
+        duplicates = dedup.find_duplicates()
+        self.assertEqual(list(duplicates.keys()), [hashlib.sha256(same_content).hexdigest()])
+        self.assertEqual(set(duplicates[hashlib.sha256(same_content).hexdigest()]), set(dups))
+    
+    def test_spill_threshold_counts_files_across_scans(self):
+        """Test that several scans spill once their combined files pass the threshold."""
+        same_content = b"duplicate content"
+        first = self.create_test_file("a/dup.txt", same_content)
+        second = self.create_test_file("b/dup.txt", same_content)
+        for i in range(4):
+            self.create_test_file(f"a/unique{i}.txt", b"a" * (i + 1))
+            self.create_test_file(f"b/unique{i}.txt", b"b" * (i + 10))
+        
+        dedup = FileDuplicateRemover(spill_threshold=6)
+        self.addCleanup(dedup.close)
+        dedup.scan_directory(self.test_dir / "a")
+        self.assertIsNone(dedup._spill_db)
+        dedup.scan_directory(self.test_dir / "b")
+        
+        self.assertIsNotNone(dedup._spill_db)
+        # Progress never runs past its total
+        self.assertEqual(dedup.total_files, dedup.processed_files)
+        duplicates = dedup.find_duplicates()
+        self.assertEqual(set(duplicates[hashlib.sha256(same_content).hexdigest()]), {first, second})
+    
+    def test_scan_spilled_groups_sizes_once(self):
+        """Test that pass 2 pages through a precomputed size table instead of regrouping per batch."""
+        same_content = b"duplicate content"
+        dups = [self.create_test_file(f"dup{i}.txt", same_content) for i in range(5)]
+        for i in range(5):
+            self.create_test_file(f"unique_size{i}.txt", b"u" * i)
+        
+        dedup = FileDuplicateRemover(spill_threshold=1)
+        statements = []
+        open_spill_db = dedup._open_spill_db
+        
+        def traced_open():
+            db = open_spill_db()
+            db.set_trace_callback(statements.append)
+            return db
+        
+        # Batches of two rows, so pass 2 needs several queries
+        with patch.object(dedup, '_open_spill_db', side_effect=traced_open), \
+                patch('data_recovery.deduplicate.SCAN_BATCH_SIZE', 2):
+            dedup.scan_directory(self.test_dir)
+        
+        grouped = [sql for sql in statements if "GROUP BY size" in sql]
+        self.assertEqual(len(grouped), 1)
+        self.assertGreater(sum("LIMIT" in sql for sql in statements), 2)
+        
+        duplicates = dedup.find_duplicates()
+        self.assertEqual(set(duplicates[hashlib.sha256(same_content).hexdigest()]), set(dups))
+        
+        dedup.close()
+        self.assertIsNone(dedup._spill_db)
+        self.assertEqual(dedup.find_duplicates(), {})
+    
     def test_find_duplicates(self):
         """Test finding duplicates."""
         # Create duplicate files
@@ -212,6 +412,31 @@ class TestFileDuplicateRemover(unittest.TestCase):
         chosen = self.deduplicator.choose_file_to_keep(files, "first_alphabetical")
         self.assertEqual(chosen.name, "apple.txt")
     
+    def test_choose_file_to_keep_largest_name_and_unknown(self):
+        """Test largest_name strategy and fallback for unknown strategies."""
+        files = [
+            self.create_test_file("a/medium_name.txt", b"content"),
+            self.create_test_file("a_much_longer_name.txt", b"content"),
+            self.create_test_file("s.txt", b"content")
+        ]
+        
+        chosen = self.deduplicator.choose_file_to_keep(files, "largest_name")
+        self.assertEqual(chosen.name, "a_much_longer_name.txt")
+        
+        chosen = self.deduplicator.choose_file_to_keep(files, "no_such_strategy")
+        self.assertEqual(chosen.name, "s.txt")
+    
+    def test_choose_file_to_keep_fills_stat_cache(self):
+        """Test that time-based strategies stat each file once into the cache."""
+        files = [
+            self.create_test_file("one.txt", b"content"),
+            self.create_test_file("two.txt", b"content")
+        ]
+        
+        stat_cache = {}
+        self.deduplicator.choose_file_to_keep(files, "oldest", stat_cache)
+        self.assertEqual(set(stat_cache), set(files))
+    
     def test_remove_duplicates_dry_run(self):
         """Test removing duplicates in dry run mode."""
         dry_dedup = FileDuplicateRemover(dry_run=True)
@@ -265,6 +490,50 @@ class TestFileDuplicateRemover(unittest.TestCase):
             # Verify unlink was attempted
             mock_unlink.assert_called()
     
+    def test_remove_duplicates_serial_reports_removals_per_set(self):
+        """Test that serial removal deletes each set before the next one is reported."""
+        self.create_test_file("a.txt", b"first content")
+        self.create_test_file("sub/a_copy.txt", b"first content")
+        self.create_test_file("b.txt", b"second content!")
+        self.create_test_file("sub/b_copy.txt", b"second content!")
+        
+        self.deduplicator.scan_directory(self.test_dir)
+        with self.assertLogs(self.deduplicator.logger, level="INFO") as logs:
+            self.deduplicator.remove_duplicates(self.deduplicator.find_duplicates(), "shortest_path")
+        
+        report = [record.getMessage().split(":")[0].strip() for record in logs.records]
+        report = [line for line in report if line in ("KEEPING", "REMOVED")]
+        self.assertEqual(report, ["KEEPING", "REMOVED"] * 2)
+    
+    def test_remove_duplicates_threaded(self):
+        """Test removing duplicates with a deletion thread pool."""
+        same_content = b"duplicate content"
+        keep = self.create_test_file("keep.txt", same_content)
+        removed = [self.create_test_file(f"subdir/copy_{i}.txt", same_content) for i in range(5)]
+        
+        dedup = FileDuplicateRemover(delete_threads=4)
+        dedup.scan_directory(self.test_dir)
+        dedup.remove_duplicates(dedup.find_duplicates(), "shortest_path")
+        
+        self.assertTrue(keep.exists())
+        self.assertFalse(any(f.exists() for f in removed))
+    
+    def test_remove_duplicates_threaded_error_handling(self):
+        """Test that unlink errors are logged, not raised, when threaded."""
+        same_content = b"duplicate content"
+        self.create_test_file("keep.txt", same_content)
+        self.create_test_file("remove1.txt", same_content)
+        self.create_test_file("remove2.txt", same_content)
+        
+        dedup = FileDuplicateRemover(delete_threads=4)
+        dedup.scan_directory(self.test_dir)
+        duplicates = dedup.find_duplicates()
+        
+        with patch('pathlib.Path.unlink') as mock_unlink:
+            mock_unlink.side_effect = OSError("Permission denied")
+            dedup.remove_duplicates(duplicates)
+            self.assertEqual(mock_unlink.call_count, 2)
+    
     def test_generate_report(self):
         """Test generating duplicate report."""
         # Create duplicate files
@@ -304,6 +573,73 @@ class TestFileDuplicateRemover(unittest.TestCase):
         self.assertEqual(new_dedup.processed_files, self.deduplicator.processed_files)
         self.assertEqual(len(new_dedup.file_hashes), len(self.deduplicator.file_hashes))
     
+    def test_save_and_load_hash_database_binary(self):
+        """Test the msgpack hash database round-trip."""
+        try:
+            import msgpack  # noqa: F401
+        except ImportError:
+            self.skipTest("msgpack not installed")
+        
+        self.create_test_file("file1.txt", b"content1")
+        self.create_test_file("file2.txt", b"content1")
+        self.create_test_file("file3.txt", b"content2")
+        
+        self.deduplicator.scan_directory(self.test_dir)
+        db_file = self.test_dir / "hashes.msgpack"
+        self.deduplicator.save_hash_database(db_file)
+        
+        # Digests are stored as raw bytes, so the file is smaller than JSON
+        json_file = self.test_dir / "hashes.json"
+        self.deduplicator.save_hash_database(json_file)
+        self.assertLess(db_file.stat().st_size, json_file.stat().st_size)
+        
+        new_dedup = FileDuplicateRemover()
+        new_dedup.load_hash_database(db_file)
+        
+        self.assertEqual(new_dedup.processed_files, self.deduplicator.processed_files)
+        self.assertEqual(dict(new_dedup.file_hashes), dict(self.deduplicator.file_hashes))
+    
+    def test_incremental_rescan_reuses_hashes(self):
+        """Test that unchanged files are not re-hashed on an incremental rescan."""
+        self.create_test_file("file1.txt", b"content1")
+        changed = self.create_test_file("file2.txt", b"content2")
+        
+        dedup = FileDuplicateRemover(incremental=True)
+        dedup.scan_directory(self.test_dir)
+        db_file = self.test_dir.parent / f"{self.test_dir.name}_index.json"
+        self.addCleanup(db_file.unlink)
+        dedup.save_hash_database(db_file)
+        
+        # Modify one file; its size changes so the stored hash is stale
+        changed.write_bytes(b"content1 and more")
+        
+        rescan = FileDuplicateRemover(incremental=True)
+        rescan.load_file_index(db_file)
+        with patch.object(rescan, 'calculate_file_hash', wraps=rescan.calculate_file_hash) as mock_hash:
+            rescan.scan_directory(self.test_dir)
+        
+        mock_hash.assert_called_once_with(str(changed))
+        self.assertEqual(rescan.reused_hashes, 1)
+        self.assertEqual(rescan.file_index[str(changed)][2],
+                         hashlib.sha256(b"content1 and more").hexdigest())
+    
+    def test_incremental_rescan_counts_reuse_across_threads(self):
+        """Test that every reused hash is counted when hash_threads > 1."""
+        for i in range(200):
+            self.create_test_file(f"file{i}.txt", f"content{i}".encode())
+        
+        dedup = FileDuplicateRemover(incremental=True)
+        dedup.scan_directory(self.test_dir)
+        db_file = self.test_dir.parent / f"{self.test_dir.name}_index.json"
+        self.addCleanup(db_file.unlink)
+        dedup.save_hash_database(db_file)
+        
+        rescan = FileDuplicateRemover(incremental=True, hash_threads=8)
+        rescan.load_file_index(db_file)
+        rescan.scan_directory(self.test_dir)
+        
+        self.assertEqual(rescan.reused_hashes, 200)
+    
     def test_large_file_handling(self):
         """Test handling of larger files."""
         # Create a larger file (1MB)
@@ -325,6 +661,22 @@ class TestFileDuplicateRemover(unittest.TestCase):
         
         filtered = self.deduplicator._filter_files(files, include_patterns=["*.jpg", "*.png"])
         self.assertEqual(len(filtered), 2)  # Should match JPG and PNG despite case
+    
+    def test_filter_files_mixed_patterns(self):
+        """Test suffix patterns combined with general glob patterns."""
+        names = ["IMG_001.JPG", "img_002.png", "notes.txt", "backup.jpg.bak",
+                 "thumb_1.jpg", "raw[1].cr2", "archive"]
+        files = [self.test_dir / name for name in names]
+        
+        filtered = self.deduplicator._filter_files(
+            files,
+            include_patterns=["*.jpg", "img_???.*", "*.CR2"],
+            exclude_patterns=["thumb_*", "*.bak"]
+        )
+        self.assertEqual([f.name for f in filtered], ["IMG_001.JPG", "img_002.png", "raw[1].cr2"])
+        
+        # A bare "*" matches everything
+        self.assertEqual(len(self.deduplicator._filter_files(files, include_patterns=["*"])), len(files))
 
 
 class TestFileDuplicateRemoverCLI(unittest.TestCase):
@@ -367,6 +719,9 @@ class TestFileDuplicateRemoverCLI(unittest.TestCase):
         mock_args.report = None
         mock_args.save_hashes = None
         mock_args.load_hashes = None
+        mock_args.delete_threads = 1
+        mock_args.incremental = False
+        mock_args.hash_threads = 1
         mock_parse_args.return_value = mock_args
         
         result = main()
@@ -396,6 +751,9 @@ class TestFileDuplicateRemoverCLI(unittest.TestCase):
         mock_args.report = report_file
         mock_args.save_hashes = None
         mock_args.load_hashes = None
+        mock_args.delete_threads = 1
+        mock_args.incremental = False
+        mock_args.hash_threads = 1
         mock_parse_args.return_value = mock_args
         
         result = main()
@@ -5,7 +5,10 @@ Tests for the file extension organizer script.
 
 import unittest
 import tempfile
-import shutil
+import hashlib
+import errno
+import os
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 import sys
@@ -13,19 +16,48 @@ import sys
 # Add the parent directory to the Python path so we can import the module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from data_recovery.move_junk import FileExtensionOrganizer
+from data_recovery._fileops import move_across_devices
+from data_recovery.move_junk import FileExtensionOrganizer, _TargetIndex
+from tests.conftest import fast_rmtree
+
+
+def _make_files(root, specs):
+    """Create files from (relative path, bytes) pairs, making each parent directory once."""
+    by_parent = {}
+    for rel_path, content in specs:
+        full_path = os.path.join(root, rel_path)
+        by_parent.setdefault(os.path.dirname(full_path), []).append((full_path, content))
+
+    for parent, files in by_parent.items():
+        os.makedirs(parent, exist_ok=True)
+        for full_path, content in files:
+            fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
 
 
 class TestFileExtensionOrganizer(unittest.TestCase):
     """Test cases for FileExtensionOrganizer class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by the tests in this class."""
+        cls.base_dir = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        fast_rmtree(cls.base_dir)
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        """Set up test fixtures in a per-test subdirectory."""
+        self.temp_dir = self.base_dir / self._testMethodName
         self.source_dir = self.temp_dir / "source"
         self.output_dir = self.temp_dir / "output"
-        self.source_dir.mkdir()
-        self.output_dir.mkdir()
+        os.makedirs(self.source_dir)
+        os.makedirs(self.output_dir)
 
         self.organizer = FileExtensionOrganizer(
             str(self.source_dir),
@@ -36,7 +68,7 @@ class TestFileExtensionOrganizer(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
+        fast_rmtree(self.temp_dir)
 
     def test_extension_normalization(self):
         """Test that extensions are properly normalized."""
@@ -65,10 +97,7 @@ class TestFileExtensionOrganizer(unittest.TestCase):
         ]
 
         # Create the files
-        for file_path in test_files:
-            full_path = self.source_dir / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.touch()
+        _make_files(self.source_dir, [(file_path, b"") for file_path in test_files])
 
         files_by_ext = self.organizer.find_files_by_extensions()
 
@@ -87,6 +116,32 @@ class TestFileExtensionOrganizer(unittest.TestCase):
         c_names = {f.name for f in files_by_ext['c']}
         self.assertEqual(c_names, {'header.c'})
 
+    def test_find_files_extension_edge_cases(self):
+        """Test that extensions are matched like Path.suffix."""
+        names = [".py", "noext", "trailing.", "archive.tar.py", "UPPER.PY", "dir.py/inner.c"]
+        _make_files(self.source_dir, [(name, b"") for name in names])
+
+        files_by_ext = self.organizer.find_files_by_extensions()
+
+        self.assertEqual({f.name for f in files_by_ext['py']}, {'archive.tar.py', 'UPPER.PY'})
+        self.assertEqual({f.name for f in files_by_ext['c']}, {'inner.c'})
+        self.assertEqual(self.organizer.stats['processed'], 3)
+
+    def test_find_files_ignores_multi_dot_extensions(self):
+        """Test that a multi-dot extension never matches, since Path.suffix has no dots."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['tar.gz', 'gz'],
+            dry_run=True
+        )
+        _make_files(self.source_dir, [("a.tar.gz", b""), ("b.gz", b"")])
+
+        files_by_ext = organizer.find_files_by_extensions()
+
+        self.assertEqual(files_by_ext['tar.gz'], [])
+        self.assertEqual({f.name for f in files_by_ext['gz']}, {'a.tar.gz', 'b.gz'})
+
     def test_create_output_directories(self):
         """Test creation of output directories."""
         organizer = FileExtensionOrganizer(
@@ -186,21 +241,71 @@ class TestFileExtensionOrganizer(unittest.TestCase):
         self.assertTrue(renamed_file.exists())
         self.assertEqual(renamed_file.read_text(), "new content")
 
+        # Further conflicts continue the numbering
+        for i in range(2, 5):
+            source_file.write_text(f"content {i}")
+            self.assertTrue(organizer.move_file(source_file, target_dir))
+            self.assertEqual((target_dir / f"test_{i}.py").read_text(), f"content {i}")
+
+    def test_move_file_cross_device_fallback(self):
+        """Test that a cross-filesystem rename falls back to copying and deleting."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            dry_run=False
+        )
+
+        target_dir = self.output_dir / "py_files"
+        target_dir.mkdir(parents=True)
+        source_file = self.source_dir / "test.py"
+        source_file.write_text("content")
+
+        with patch('data_recovery._fileops.os.replace',
+                   side_effect=OSError(errno.EXDEV, os.strerror(errno.EXDEV))), \
+                patch('data_recovery._fileops.move_across_devices', wraps=move_across_devices) as mock_move:
+            self.assertTrue(organizer.move_file(source_file, target_dir))
+
+        mock_move.assert_called_once()
+        self.assertFalse(source_file.exists())
+        self.assertEqual((target_dir / "test.py").read_text(), "content")
+
+    def test_move_file_failure_releases_name(self):
+        """Test that a failed move leaves no placeholder behind in the target directory."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            dry_run=False
+        )
+
+        target_dir = self.output_dir / "py_files"
+        target_dir.mkdir(parents=True)
+        source_file = self.source_dir / "test.py"
+        source_file.write_text("content")
+
+        with patch('data_recovery._fileops.os.replace', side_effect=OSError(errno.EIO, "I/O error")):
+            self.assertFalse(organizer.move_file(source_file, target_dir))
+
+        self.assertTrue(source_file.exists())
+        self.assertEqual(list(target_dir.iterdir()), [])
+
+        # The name is free again for the next attempt
+        self.assertTrue(organizer.move_file(source_file, target_dir))
+        self.assertEqual((target_dir / "test.py").read_text(), "content")
+
     def test_organize_files_integration(self):
         """Test the complete organization process."""
         # Create test files
         test_files = [
-            ("script1.py", "# Python script 1"),
-            ("nested/script2.py", "# Python script 2"),
-            ("Program.java", "// Java program"),
-            ("header.c", "/* C header */"),
-            ("image.jpg", "fake image"),  # Should be ignored
+            ("script1.py", b"# Python script 1"),
+            ("nested/script2.py", b"# Python script 2"),
+            ("Program.java", b"// Java program"),
+            ("header.c", b"/* C header */"),
+            ("image.jpg", b"fake image"),  # Should be ignored
         ]
 
-        for file_path, content in test_files:
-            full_path = self.source_dir / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content)
+        _make_files(self.source_dir, test_files)
 
         # Run organization
         stats = self.organizer.organize_files()
@@ -232,6 +337,11 @@ class TestFileExtensionOrganizer(unittest.TestCase):
         empty_dir = self.source_dir / "empty"
         empty_dir.mkdir()
 
+        # A directory that still holds a file, and its parent, must survive
+        kept_file = self.source_dir / "keep" / "inner" / "notes.txt"
+        kept_file.parent.mkdir(parents=True)
+        kept_file.write_text("keep me")
+
         # Move the file (this will leave empty directories)
         target_dir = self.output_dir / "py_files"
         target_dir.mkdir(parents=True)
@@ -249,6 +359,7 @@ class TestFileExtensionOrganizer(unittest.TestCase):
         # Verify empty directories were removed
         self.assertFalse((self.source_dir / "deep").exists())
         self.assertFalse(empty_dir.exists())
+        self.assertTrue(kept_file.exists())
 
         # Source directory should still exist
         self.assertTrue(self.source_dir.exists())
@@ -257,17 +368,27 @@ class TestFileExtensionOrganizer(unittest.TestCase):
 class TestDuplicateHandling(unittest.TestCase):
     """Test cases for duplicate detection and removal functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by the tests in this class."""
+        cls.base_dir = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        fast_rmtree(cls.base_dir)
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        """Set up test fixtures in a per-test subdirectory."""
+        self.temp_dir = self.base_dir / self._testMethodName
         self.source_dir = self.temp_dir / "source"
         self.output_dir = self.temp_dir / "output"
-        self.source_dir.mkdir()
-        self.output_dir.mkdir()
+        os.makedirs(self.source_dir)
+        os.makedirs(self.output_dir)
 
     def tearDown(self):
         """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
+        fast_rmtree(self.temp_dir)
 
     def test_files_are_identical_size_method(self):
         """Test duplicate detection using size comparison."""
@@ -294,6 +415,30 @@ class TestDuplicateHandling(unittest.TestCase):
         # Test different files (different size)
         self.assertFalse(organizer.files_are_identical(file1, file3))
 
+    def test_files_are_identical_sees_changes_between_calls(self):
+        """Test that stats are not cached across calls made outside an organize_files run."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            skip_duplicates=True,
+            dedupe_method='size'
+        )
+        file1 = self.source_dir / "file1.py"
+        file2 = self.source_dir / "file2.py"
+        file1.write_text("print('hello')")
+        file2.write_text("print('world')")
+
+        organizer.organize_files()
+        self.assertIsNone(organizer._file_stats)
+
+        file1.write_text("print('hello')")
+        file2.write_text("print('world')")
+        self.assertTrue(organizer.files_are_identical(file1, file2))
+
+        file2.write_text("print('hello world')")
+        self.assertFalse(organizer.files_are_identical(file1, file2))
+
     def test_files_are_identical_hash_method(self):
         """Test duplicate detection using hash comparison."""
         organizer = FileExtensionOrganizer(
@@ -353,6 +498,59 @@ class TestDuplicateHandling(unittest.TestCase):
         # Test same size, different content (should fail on hash check)
         self.assertFalse(organizer.files_are_identical(file1, file4))
 
+    def test_files_are_identical_hash_skips_different_sizes(self):
+        """Test that hash mode never hashes files whose sizes differ."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            dedupe_method='hash'
+        )
+
+        file1 = self.source_dir / "file1.py"
+        file2 = self.source_dir / "file2.py"
+        file1.write_text("short")
+        file2.write_text("much longer content")
+
+        with patch.object(organizer, 'get_file_hash') as mock_hash:
+            self.assertFalse(organizer.files_are_identical(file1, file2))
+            mock_hash.assert_not_called()
+
+    def test_files_are_identical_hard_links(self):
+        """Test that hard links to one file match without hashing."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            dedupe_method='hash'
+        )
+
+        file1 = self.source_dir / "file1.py"
+        file2 = self.source_dir / "file2.py"
+        file1.write_text("print('hello')")
+        os.link(file1, file2)
+
+        with patch.object(organizer, 'get_file_hash') as mock_hash:
+            self.assertTrue(organizer.files_are_identical(file1, file2))
+            mock_hash.assert_not_called()
+
+    def test_files_are_identical_unreadable_files(self):
+        """Test that two failed hashes are not treated as a match."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            dedupe_method='hash'
+        )
+
+        file1 = self.source_dir / "file1.py"
+        file2 = self.source_dir / "file2.py"
+        file1.write_text("same")
+        file2.write_text("same")
+
+        with patch.object(organizer, 'get_file_hash', return_value=""):
+            self.assertFalse(organizer.files_are_identical(file1, file2))
+
     def test_skip_duplicates_functionality(self):
         """Test skip duplicates functionality without removal."""
         # Create organizer with skip duplicates enabled
@@ -565,6 +763,99 @@ class TestDuplicateHandling(unittest.TestCase):
         self.assertFalse(unique.exists())
         self.assertTrue((target_dir / "unique.py").exists())
 
+    def test_duplicate_sources_and_single_target_scan(self):
+        """Test that moved files join the index and each file is hashed once."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            dry_run=False,
+            skip_duplicates=True,
+            dedupe_method='both'
+        )
+
+        target_dir = self.output_dir / "py_files"
+        target_dir.mkdir(parents=True)
+        (target_dir / "existing.py").write_text("print('hello')")
+        (target_dir / "other_size.py").write_text("print('a much longer line')")
+
+        # Two identical sources that differ from every target
+        (self.source_dir / "copy1.py").write_text("print('world')")
+        (self.source_dir / "copy2.py").write_text("print('world')")
+
+        with patch.object(organizer, 'get_file_hash', wraps=organizer.get_file_hash) as mock_hash:
+            stats = organizer.organize_files()
+
+        self.assertEqual(stats['moved'], 1)
+        self.assertEqual(stats['duplicates_skipped'], 1)
+        # existing.py once, each source once, the moved copy once; other_size.py never
+        hashed = [os.path.basename(call.args[0]) for call in mock_hash.call_args_list]
+        self.assertNotIn("other_size.py", hashed)
+        self.assertEqual(hashed.count("existing.py"), 1)
+
+    def test_concurrent_moves_and_duplicate_checks(self):
+        """Test that concurrent workers neither overwrite same-named files nor move identical ones twice."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            dry_run=False,
+            skip_duplicates=True,
+            dedupe_method='hash',
+            max_concurrency=8
+        )
+
+        # Same name everywhere; ten distinct contents, each present three times
+        _make_files(self.source_dir, [(f"dir{i}/main.py", f"print({i % 10})".encode()) for i in range(30)])
+
+        stats = organizer.organize_files()
+
+        self.assertEqual(stats['moved'], 10)
+        self.assertEqual(stats['duplicates_skipped'], 20)
+        self.assertEqual(stats['errors'], 0)
+
+        target_dir = self.output_dir / "py_files"
+        contents = sorted(path.read_text() for path in target_dir.iterdir())
+        self.assertEqual(contents, sorted(f"print({i})" for i in range(10)))
+
+    def test_target_index_hashes_without_holding_lock(self):
+        """Test that claim() hashes the source and indexed targets with the index lock released."""
+        hashes = {"/target/a.py": "same", "/source/b.py": "same"}
+        hashed = []
+
+        def hash_file(path):
+            # Another thread must be able to use the index while this hash runs
+            probe = threading.Thread(target=index.has_size, args=(1,))
+            probe.start()
+            probe.join(timeout=5)
+            self.assertFalse(probe.is_alive())
+            hashed.append(path)
+            return hashes[path]
+
+        index = _TargetIndex(hash_file)
+        index.add("/target/a.py", 3)
+
+        self.assertEqual(index.claim("/source/b.py", 3, compare_hash=True), (True, "same"))
+        self.assertEqual(sorted(hashed), ["/source/b.py", "/target/a.py"])
+
+    def test_sequential_conflict_names_follow_path_order(self):
+        """Test that a sequential run renames same-named files in sorted path order."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            dry_run=False,
+            max_concurrency=1
+        )
+        _make_files(self.source_dir, [(f"{d}/main.py", d.encode()) for d in ("c", "a", "b")])
+
+        organizer.organize_files()
+
+        target_dir = self.output_dir / "py_files"
+        self.assertEqual((target_dir / "main.py").read_text(), "a")
+        self.assertEqual((target_dir / "main_1.py").read_text(), "b")
+        self.assertEqual((target_dir / "main_2.py").read_text(), "c")
+
     def test_get_file_hash_method(self):
         """Test the file hash calculation method."""
         organizer = FileExtensionOrganizer(
@@ -601,6 +892,103 @@ class TestDuplicateHandling(unittest.TestCase):
         # Different content should produce different hash
         self.assertNotEqual(hash1, hash3)
 
+        # The algorithm can be chosen; unknown algorithms give an empty hash
+        self.assertEqual(organizer.get_file_hash(file1, 'sha256'),
+                         hashlib.sha256(content1.encode()).hexdigest())
+        self.assertEqual(organizer.get_file_hash(file1, 'no-such-hash'), "")
+
+    def test_get_file_hash_algo_and_chunking(self):
+        """Test that hash_algo sets the default and files larger than one read hash correctly."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            hash_algo='sha256'
+        )
+
+        content = bytes(range(256)) * 100
+        big_file = self.source_dir / "big.py"
+        big_file.write_bytes(content)
+        empty_file = self.source_dir / "empty.py"
+        empty_file.touch()
+
+        with patch('data_recovery.move_junk.HASH_CHUNK_SIZE', 1000):
+            self.assertEqual(organizer.get_file_hash(big_file), hashlib.sha256(content).hexdigest())
+        self.assertEqual(organizer.get_file_hash(empty_file), hashlib.sha256(b"").hexdigest())
+
+    def test_get_file_hash_reuses_read_buffer(self):
+        """Test that one thread's hashes share a read buffer that only grows for larger files."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py']
+        )
+
+        large = self.source_dir / "large.py"
+        large.write_bytes(b"x" * 5000)
+        small = self.source_dir / "small.py"
+        small.write_bytes(b"y" * 10)
+
+        self.assertEqual(organizer.get_file_hash(large), hashlib.blake2b(b"x" * 5000).hexdigest())
+        buffer = organizer._local.buffer
+        self.assertEqual(organizer.get_file_hash(small), hashlib.blake2b(b"y" * 10).hexdigest())
+        self.assertIs(organizer._local.buffer, buffer)
+
+    def test_get_file_hash_cached_per_file(self):
+        """Test that an unchanged file is read once, and re-read after it changes."""
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py']
+        )
+
+        test_file = self.source_dir / "test.py"
+        test_file.write_text("print('hello')")
+
+        with patch('data_recovery.move_junk.hashlib.new', wraps=hashlib.new) as mock_new:
+            first = organizer.get_file_hash(test_file)
+            self.assertEqual(organizer.get_file_hash(test_file), first)
+            self.assertEqual(mock_new.call_count, 1)
+
+            # A different algorithm is a different cache entry
+            organizer.get_file_hash(test_file, 'sha256')
+            self.assertEqual(mock_new.call_count, 2)
+
+            test_file.write_text("print('changed')")
+            self.assertNotEqual(organizer.get_file_hash(test_file), first)
+
+    def test_get_file_hash_xxh3(self):
+        """Test the optional xxhash algorithms."""
+        try:
+            import xxhash
+        except ImportError:
+            self.skipTest("xxhash not installed")
+
+        organizer = FileExtensionOrganizer(
+            str(self.source_dir),
+            str(self.output_dir),
+            ['py'],
+            hash_algo='xxh3_128'
+        )
+
+        content = b"print('hello')"
+        test_file = self.source_dir / "test.py"
+        test_file.write_bytes(content)
+
+        self.assertEqual(organizer.get_file_hash(test_file), xxhash.xxh3_128(content).hexdigest())
+        self.assertEqual(organizer.get_file_hash(test_file, 'xxh3_64'), xxhash.xxh3_64(content).hexdigest())
+
+    def test_xxh3_without_xxhash(self):
+        """Test that choosing xxh3 without the xxhash package fails up front."""
+        with patch('data_recovery.move_junk.xxhash', None):
+            with self.assertRaises(ImportError):
+                FileExtensionOrganizer(
+                    str(self.source_dir),
+                    str(self.output_dir),
+                    ['py'],
+                    hash_algo='xxh3_128'
+                )
+
 
 class TestCommandLineValidation(unittest.TestCase):
     """Test command line argument validation for duplicate features."""
@@ -613,24 +1001,21 @@ class TestCommandLineValidation(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
+        fast_rmtree(self.temp_dir)
 
-    @patch('sys.argv', ['move_junk.py', 'py', '--remove-source-dupes'])
     def test_remove_source_dupes_requires_skip_duplicates(self):
         """Test that --remove-source-dupes requires --skip-duplicates."""
         from data_recovery.move_junk import main
 
-        with patch('data_recovery.move_junk.Path') as mock_path:
-            mock_path.return_value.exists.return_value = True
-            mock_path.return_value.is_dir.return_value = True
-
+        argv = ['move_junk.py', 'py', '--remove-source-dupes',
+                '--source', str(self.source_dir), '--output', str(self.temp_dir / 'out')]
+        with patch('sys.argv', argv):
             result = main()
 
             # Should return error code 1
             self.assertEqual(result, 1)
 
     @patch('data_recovery.move_junk.FileExtensionOrganizer')
-    @patch('sys.argv', ['move_junk.py', 'py', '--skip-duplicates', '--remove-source-dupes'])
     def test_valid_duplicate_arguments(self, mock_organizer_class):
         """Test valid combination of duplicate arguments."""
         from data_recovery.move_junk import main
@@ -647,10 +1032,9 @@ class TestCommandLineValidation(unittest.TestCase):
         }
         mock_organizer_class.return_value = mock_organizer
 
-        with patch('data_recovery.move_junk.Path') as mock_path:
-            mock_path.return_value.exists.return_value = True
-            mock_path.return_value.is_dir.return_value = True
-
+        argv = ['move_junk.py', 'py', '--skip-duplicates', '--remove-source-dupes',
+                '--source', str(self.source_dir), '--output', str(self.temp_dir / 'out')]
+        with patch('sys.argv', argv):
             result = main()
 
             # Should succeed
@@ -674,10 +1058,9 @@ class TestCommandLineInterface(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
+        fast_rmtree(self.temp_dir)
 
     @patch('data_recovery.move_junk.FileExtensionOrganizer')
-    @patch('sys.argv', ['move_junk.py', 'py', 'java', '--dry-run'])
     def test_main_with_dry_run(self, mock_organizer_class):
         """Test main function with dry run."""
         from data_recovery.move_junk import main
@@ -694,10 +1077,9 @@ class TestCommandLineInterface(unittest.TestCase):
         }
         mock_organizer_class.return_value = mock_organizer
 
-        with patch('data_recovery.move_junk.Path') as mock_path:
-            mock_path.return_value.exists.return_value = True
-            mock_path.return_value.is_dir.return_value = True
-
+        argv = ['move_junk.py', 'py', 'java', '--dry-run',
+                '--source', str(self.source_dir), '--output', str(self.temp_dir / 'out')]
+        with patch('sys.argv', argv):
             result = main()
 
             self.assertEqual(result, 0)
@@ -705,7 +1087,6 @@ class TestCommandLineInterface(unittest.TestCase):
             mock_organizer.organize_files.assert_called_once()
 
     @patch('data_recovery.move_junk.FileExtensionOrganizer')
-    @patch('sys.argv', ['move_junk.py', 'py', '--skip-duplicates', '--remove-source-dupes', '--dedupe-method', 'hash'])
     def test_main_with_duplicate_options(self, mock_organizer_class):
         """Test main function with duplicate handling options."""
         from data_recovery.move_junk import main
@@ -722,10 +1103,9 @@ class TestCommandLineInterface(unittest.TestCase):
         }
         mock_organizer_class.return_value = mock_organizer
 
-        with patch('data_recovery.move_junk.Path') as mock_path:
-            mock_path.return_value.exists.return_value = True
-            mock_path.return_value.is_dir.return_value = True
-
+        argv = ['move_junk.py', 'py', '--skip-duplicates', '--remove-source-dupes', '--dedupe-method', 'hash',
+                '--source', str(self.source_dir), '--output', str(self.temp_dir / 'out')]
+        with patch('sys.argv', argv):
             result = main()
 
             self.assertEqual(result, 0)
@@ -7,8 +7,12 @@ import unittest
 import tempfile
 import shutil
 from pathlib import Path
+from pyfakefs import fake_filesystem_unittest
 from unittest.mock import Mock, patch, MagicMock
+import asyncio
+import errno
 import os
+import subprocess
 import sys
 
 # Add the parent directory to the Python path so we can import the module
@@ -17,12 +21,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from data_recovery.sort_music import MusicOrganizer
 
 
-class TestMusicOrganizer(unittest.TestCase):
+class TestMusicOrganizer(fake_filesystem_unittest.TestCase):
     """Test cases for MusicOrganizer class."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        """Set up test fixtures on an in-memory filesystem."""
+        self.setUpPyfakefs()
+        self.temp_dir = Path("/work")
+        self.temp_dir.mkdir()
         self.source_dir = self.temp_dir / "source"
         self.target_dir = self.temp_dir / "target"
         self.source_dir.mkdir()
@@ -31,13 +37,10 @@ class TestMusicOrganizer(unittest.TestCase):
         self.organizer = MusicOrganizer(
             str(self.source_dir),
             str(self.target_dir),
-            dry_run=True
+            dry_run=True,
+            max_workers=1
         )
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-
     def test_sanitize_filename(self):
         """Test filename sanitization."""
         test_cases = [
@@ -47,6 +50,7 @@ class TestMusicOrganizer(unittest.TestCase):
             ("   .Leading dots and spaces   ", "Leading dots and spaces"),
             ("", "Unknown"),
             ("A" * 250, "A" * 200),  # Length limit
+            ("AC/DC\\Live", "AC_DC_Live"),  # Path separators
         ]
 
         for input_name, expected in test_cases:
@@ -66,9 +70,8 @@ class TestMusicOrganizer(unittest.TestCase):
         }
 
         with patch('data_recovery.sort_music.MutagenFile') as mock_mutagen:
-            mock_file = Mock()
-            mock_file.__contains__ = lambda self, key: key in mock_metadata
-            mock_file.__getitem__ = lambda self, key: mock_metadata[key]
+            # A dict answers the `in` and [] lookups made on a mutagen file
+            mock_file = dict(mock_metadata)
             mock_mutagen.return_value = mock_file
 
             test_file = self.source_dir / "test.mp3"
@@ -96,9 +99,8 @@ class TestMusicOrganizer(unittest.TestCase):
         }
 
         with patch('data_recovery.sort_music.MutagenFile') as mock_mutagen:
-            mock_file = Mock()
-            mock_file.__contains__ = lambda self, key: key in mock_metadata
-            mock_file.__getitem__ = lambda self, key: mock_metadata[key]
+            # A dict answers the `in` and [] lookups made on a mutagen file
+            mock_file = dict(mock_metadata)
             mock_mutagen.return_value = mock_file
 
             test_file = self.source_dir / "test.flac"
@@ -200,6 +202,24 @@ class TestMusicOrganizer(unittest.TestCase):
         self.assertEqual(sorted(found_names), sorted(expected_names))
         self.assertEqual(len(found_files), 4)
 
+    def test_find_music_files_threaded_matches_serial(self):
+        """Test that the threaded walk returns the serial walk's files in the same order."""
+        for i in range(3):
+            for j in range(3):
+                full_path = self.source_dir / f"artist{i}" / f"album{j}" / f"song{j}.mp3"
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                full_path.touch()
+        (self.source_dir / "artist0" / "notes.txt").touch()
+        (self.source_dir / "loose.mp3").touch()
+
+        serial = MusicOrganizer(str(self.source_dir), str(self.target_dir), dry_run=True, walk_workers=1)
+        expected = serial.find_music_files()
+
+        self.assertEqual(len(expected), 10)
+        self.assertEqual(expected[0], self.source_dir / "loose.mp3")
+        for _ in range(5):
+            self.assertEqual(self.organizer.find_music_files(), expected)
+
     def test_move_file_dry_run(self):
         """Test file moving in dry run mode."""
         source_file = self.source_dir / "test.mp3"
@@ -223,7 +243,8 @@ class TestMusicOrganizer(unittest.TestCase):
         organizer = MusicOrganizer(
             str(self.source_dir),
             str(self.target_dir),
-            dry_run=False
+            dry_run=False,
+            max_workers=1
         )
 
         source_file = self.source_dir / "test.mp3"
@@ -243,7 +264,8 @@ class TestMusicOrganizer(unittest.TestCase):
         organizer = MusicOrganizer(
             str(self.source_dir),
             str(self.target_dir),
-            dry_run=False
+            dry_run=False,
+            max_workers=1
         )
 
         # Create existing target file
@@ -268,6 +290,28 @@ class TestMusicOrganizer(unittest.TestCase):
         self.assertTrue(renamed_file.exists())
         self.assertEqual(renamed_file.read_text(), "new content")
 
+    def test_move_file_many_duplicates_numbered_in_sequence(self):
+        """Test that repeated conflicts get _1, _2, ... without re-probing earlier names."""
+        organizer = MusicOrganizer(
+            str(self.source_dir),
+            str(self.target_dir),
+            dry_run=False,
+            max_workers=1
+        )
+        target_file = self.target_dir / "Artist" / "Album" / "Song.mp3"
+
+        for i in range(5):
+            source_file = self.source_dir / f"take{i}.mp3"
+            source_file.write_text(f"take {i}")
+            self.assertTrue(organizer.move_file(source_file, target_file))
+
+        album_dir = target_file.parent
+        self.assertEqual(
+            sorted(f.name for f in album_dir.iterdir()),
+            ["Song.mp3", "Song_1.mp3", "Song_2.mp3", "Song_3.mp3", "Song_4.mp3"]
+        )
+        self.assertEqual((album_dir / "Song_4.mp3").read_text(), "take 4")
+
     @patch('data_recovery.sort_music.MutagenFile')
     def test_organize_music_integration(self, mock_mutagen):
         """Test the complete organization process."""
@@ -279,9 +323,8 @@ class TestMusicOrganizer(unittest.TestCase):
             'TRCK': ['1']
         }
 
-        mock_file = Mock()
-        mock_file.__contains__ = lambda self, key: key in mock_metadata
-        mock_file.__getitem__ = lambda self, key: mock_metadata[key]
+        # A dict answers the `in` and [] lookups made on a mutagen file
+        mock_file = dict(mock_metadata)
         mock_mutagen.return_value = mock_file
 
         # Create test files
@@ -304,6 +347,216 @@ class TestMusicOrganizer(unittest.TestCase):
         self.assertEqual(stats['moved'], 2)
         self.assertEqual(stats['errors'], 0)
 
+    def test_organize_music_reuses_cache(self):
+        """Test that tags read on one run are reused by the next for unchanged files."""
+        cache_path = self.temp_dir / "tags.cache"
+        (self.source_dir / "song.mp3").write_text("audio")
+
+        # A dict answers the `in` and [] lookups made on a mutagen file
+        mock_audio = {'TPE1': ['Cached Artist'], 'TALB': ['Cached Album'], 'TIT2': ['Song']}
+
+        def run():
+            organizer = MusicOrganizer(
+                str(self.source_dir),
+                str(self.target_dir),
+                dry_run=True,
+                max_workers=1,
+                cache_path=str(cache_path)
+            )
+            with patch.object(organizer, 'move_file', return_value=True) as mock_move:
+                organizer.organize_music()
+            return mock_move.call_args.args[1]
+
+        with patch('data_recovery.sort_music.MutagenFile', return_value=mock_audio) as mock_mutagen:
+            first_target = run()
+            mock_mutagen.reset_mock()
+            self.assertEqual(run(), first_target)
+            mock_mutagen.assert_not_called()
+
+        self.assertEqual(first_target, self.target_dir / "Cached Artist" / "Cached Album" / "Song.mp3")
+
+    def test_cache_keeps_entries_from_other_source_trees(self):
+        """Test that a run over one tree keeps the cached tags of another tree sharing the cache."""
+        cache_path = self.temp_dir / "tags.cache"
+        other_dir = self.temp_dir / "source2"
+        other_dir.mkdir()
+        (self.source_dir / "song.mp3").write_text("audio")
+        (self.source_dir / "changed.mp3").write_text("audio")
+        (other_dir / "other.mp3").write_text("audio")
+
+        def run(source_dir):
+            organizer = MusicOrganizer(str(source_dir), str(self.target_dir), dry_run=True,
+                                       max_workers=1, cache_path=str(cache_path))
+            with patch.object(organizer, 'move_file', return_value=True):
+                organizer.organize_music()
+            return organizer._metadata_cache
+
+        with patch('data_recovery.sort_music.MutagenFile', return_value=None) as mock_mutagen:
+            run(self.source_dir)
+            run(other_dir)
+            (self.source_dir / "changed.mp3").write_text("longer audio")
+            mock_mutagen.reset_mock()
+            cache = run(self.source_dir)
+
+        # Only the edited file is read again, and only its newest version stays cached
+        mock_mutagen.assert_called_once()
+        self.assertEqual(sorted(Path(key[0]).name for key in cache), ["changed.mp3", "other.mp3", "song.mp3"])
+
+    def test_organize_music_async_keeps_every_duplicate(self):
+        """Test that concurrent moves of same-named files never overwrite each other."""
+        organizer = MusicOrganizer(
+            str(self.source_dir),
+            str(self.target_dir),
+            dry_run=False,
+            max_workers=1
+        )
+
+        # Same name in different folders, all headed for Unknown Artist/Unknown Album/song.mp3
+        for i in range(8):
+            folder = self.source_dir / f"disc{i}"
+            folder.mkdir()
+            (folder / "song.mp3").write_text(f"take {i}")
+
+        with patch('data_recovery.sort_music.MutagenFile', return_value=None):
+            stats = asyncio.run(organizer.organize_music_async(max_concurrency=4))
+
+        self.assertEqual(stats['moved'], 8)
+        self.assertEqual(stats['errors'], 0)
+        album_dir = self.target_dir / "Unknown Artist" / "Unknown Album"
+        contents = sorted(f.read_text() for f in album_dir.iterdir())
+        self.assertEqual(contents, sorted(f"take {i}" for i in range(8)))
+
+
+class TestMusicOrganizerOnDisk(unittest.TestCase):
+    """Tests that need a real filesystem: process pool workers talk over OS pipes
+    and copy_file_range works on real file descriptors."""
+
+    def setUp(self):
+        """Set up test fixtures on disk."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_dir / "source"
+        self.target_dir = self.temp_dir / "target"
+        self.source_dir.mkdir()
+        self.target_dir.mkdir()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_organize_music_process_pool(self):
+        """Test that tags are read on a process pool when several workers are allowed."""
+        organizer = MusicOrganizer(
+            str(self.source_dir),
+            str(self.target_dir),
+            dry_run=True,
+            max_workers=2
+        )
+
+        # Files with no readable tags land under Unknown Artist
+        for i in range(4):
+            (self.source_dir / f"song{i}.mp3").touch()
+
+        with patch.object(organizer, 'move_file', return_value=True) as mock_move:
+            stats = organizer.organize_music()
+
+        self.assertEqual(stats['processed'], 4)
+        self.assertEqual(stats['moved'], 4)
+        targets = sorted(call.args[1] for call in mock_move.call_args_list)
+        expected = sorted(self.target_dir / "Unknown Artist" / "Unknown Album" / f"song{i}.mp3" for i in range(4))
+        self.assertEqual(targets, expected)
+
+    def _move_across_devices(self, **copy_file_range_patch):
+        """Move a file with os.replace reporting a cross-device rename."""
+        organizer = MusicOrganizer(
+            str(self.source_dir),
+            str(self.target_dir),
+            dry_run=False,
+            max_workers=1
+        )
+
+        source_file = self.source_dir / "test.mp3"
+        source_file.write_text("test content")
+        os.utime(source_file, (1_000_000_000, 1_000_000_000))
+        target_file = self.target_dir / "Artist" / "Album" / "01 - Song.mp3"
+
+        with patch('data_recovery._fileops.os.replace',
+                   side_effect=OSError(errno.EXDEV, os.strerror(errno.EXDEV))), \
+                patch('data_recovery._fileops.os.copy_file_range', create=True,
+                      **copy_file_range_patch) as mock_copy_file_range, \
+                patch('data_recovery._fileops.shutil.copy2', wraps=shutil.copy2) as mock_copy2:
+            self.assertTrue(organizer.move_file(source_file, target_file))
+
+        self.assertFalse(source_file.exists())
+        self.assertEqual(target_file.read_text(), "test content")
+        # Metadata comes along with the contents
+        self.assertEqual(target_file.stat().st_mtime, 1_000_000_000)
+        return mock_copy_file_range, mock_copy2
+
+    @unittest.skipUnless(hasattr(os, 'copy_file_range'), "needs os.copy_file_range")
+    def test_move_file_cross_device_uses_copy_file_range(self):
+        """Test that a cross-filesystem move copies in-kernel with copy_file_range."""
+        mock_copy_file_range, mock_copy2 = self._move_across_devices(wraps=getattr(os, 'copy_file_range', None))
+
+        mock_copy_file_range.assert_called()
+        mock_copy2.assert_not_called()
+
+    def test_move_file_cross_device_falls_back_to_copy2(self):
+        """Test that copy2 takes over when copy_file_range can't copy between the filesystems."""
+        mock_copy_file_range, mock_copy2 = self._move_across_devices(
+            side_effect=OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        )
+
+        mock_copy2.assert_called_once()
+
+    def test_move_file_cross_device_short_copy_file_range(self):
+        """Test that copy_file_range returning 0 early is not taken as a finished copy."""
+        # _move_across_devices checks the source is gone and the target holds all of it
+        mock_copy_file_range, mock_copy2 = self._move_across_devices(return_value=0)
+
+        mock_copy_file_range.assert_called()
+        mock_copy2.assert_called_once()
+
+    def test_move_file_cross_device_keeps_source_on_short_copy(self):
+        """Test that the source survives when the copy comes out shorter than the original."""
+        organizer = MusicOrganizer(str(self.source_dir), str(self.target_dir), dry_run=False, max_workers=1)
+        source_file = self.source_dir / "test.mp3"
+        source_file.write_text("test content")
+        target_file = self.target_dir / "Artist" / "Album" / "01 - Song.mp3"
+
+        def truncated_copy(src, dst):
+            Path(dst).write_text("test")
+
+        with patch('data_recovery._fileops.os.replace',
+                   side_effect=OSError(errno.EXDEV, os.strerror(errno.EXDEV))), \
+                patch('data_recovery._fileops.os.copy_file_range', create=True,
+                      side_effect=OSError(errno.EXDEV, os.strerror(errno.EXDEV))), \
+                patch('data_recovery._fileops.shutil.copy2', side_effect=truncated_copy):
+            self.assertFalse(organizer.move_file(source_file, target_file))
+
+        self.assertEqual(source_file.read_text(), "test content")
+        self.assertFalse(target_file.exists())
+
+    def test_move_file_cross_device_removes_partial_copy_on_error(self):
+        """Test that a copy failing part-way leaves no truncated file under the target name."""
+        organizer = MusicOrganizer(str(self.source_dir), str(self.target_dir), dry_run=False, max_workers=1)
+        source_file = self.source_dir / "test.mp3"
+        source_file.write_text("test content")
+        target_file = self.target_dir / "Artist" / "Album" / "01 - Song.mp3"
+
+        def failing_copy(src, dst):
+            Path(dst).write_text("test")
+            raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+
+        with patch('data_recovery._fileops.os.replace',
+                   side_effect=OSError(errno.EXDEV, os.strerror(errno.EXDEV))), \
+                patch('data_recovery._fileops.os.copy_file_range', create=True,
+                      side_effect=OSError(errno.EXDEV, os.strerror(errno.EXDEV))), \
+                patch('data_recovery._fileops.shutil.copy2', side_effect=failing_copy):
+            self.assertFalse(organizer.move_file(source_file, target_file))
+
+        self.assertEqual(source_file.read_text(), "test content")
+        self.assertFalse(target_file.exists())
+
 
 class TestCommandLineInterface(unittest.TestCase):
     """Test the command line interface."""
@@ -319,6 +572,18 @@ class TestCommandLineInterface(unittest.TestCase):
         """Clean up test fixtures."""
         shutil.rmtree(self.temp_dir)
 
+    def test_import_does_not_load_mutagen(self):
+        """Test that mutagen is only imported once tags are read."""
+        code = "import sys, data_recovery.sort_music; print('mutagen' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
     @patch('data_recovery.sort_music.MusicOrganizer')
     @patch('sys.argv', ['sort_music.py', 'source', 'target', '--dry-run'])
     def test_main_dry_run(self, mock_organizer_class):
@@ -341,7 +606,7 @@ class TestCommandLineInterface(unittest.TestCase):
             result = main()
 
             self.assertEqual(result, 0)
-            mock_organizer_class.assert_called_once_with('source', 'target', True)
+            mock_organizer_class.assert_called_once_with('source', 'target', True, cache_path=None)
             mock_organizer.organize_music.assert_called_once()
 
 
@@ -7,8 +7,11 @@ import unittest
 import tempfile
 import shutil
 from pathlib import Path
+from pyfakefs import fake_filesystem_unittest
 from unittest.mock import Mock, patch, MagicMock
+import errno
 import os
+import pickle
 import sys
 from datetime import datetime
 
@@ -18,12 +21,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from data_recovery.sort_photos import PhotoOrganizer
 
 
-class TestPhotoOrganizer(unittest.TestCase):
+class TestPhotoOrganizer(fake_filesystem_unittest.TestCase):
     """Test cases for PhotoOrganizer class."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        """Set up test fixtures on an in-memory filesystem."""
+        self.setUpPyfakefs()
+        self.temp_dir = Path("/work")
+        self.temp_dir.mkdir()
         self.source_dir = self.temp_dir / "source"
         self.target_dir = self.temp_dir / "target"
         self.source_dir.mkdir()
@@ -32,13 +37,10 @@ class TestPhotoOrganizer(unittest.TestCase):
         self.organizer = PhotoOrganizer(
             str(self.source_dir),
             str(self.target_dir),
-            dry_run=True
+            dry_run=True,
+            max_workers=1
         )
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-
     def create_test_file(self, filename: str, content: bytes = b"fake image data") -> Path:
         """Create a test file with given content."""
         file_path = self.source_dir / filename
@@ -138,6 +140,20 @@ class TestPhotoOrganizer(unittest.TestCase):
             result = self.organizer.extract_exif_date(test_file)
             self.assertEqual(result, (None, False))
 
+    @patch('data_recovery.sort_photos.Image')
+    def test_extract_exif_date_zeroed(self, mock_image):
+        """Test that a well-formed but zeroed EXIF date is treated as missing."""
+        mock_img = MagicMock()
+        mock_image.open.return_value.__enter__.return_value = mock_img
+
+        # Some cameras write all zeros when the clock was never set
+        mock_img._getexif.return_value = {36867: "0000:00:00 00:00:00"}
+
+        with patch('data_recovery.sort_photos.TAGS', {36867: 'DateTimeOriginal'}):
+            test_file = self.create_test_file("test.jpg")
+            result = self.organizer.extract_exif_date(test_file)
+            self.assertEqual(result, (None, False))
+
     @patch('data_recovery.sort_photos.Image')
     def test_extract_exif_date_alternative_format(self, mock_image):
         """Test extraction with alternative date format."""
@@ -202,7 +218,8 @@ class TestPhotoOrganizer(unittest.TestCase):
         organizer = PhotoOrganizer(
             str(self.source_dir),
             str(self.target_dir),
-            dry_run=False
+            dry_run=False,
+            max_workers=1
         )
         
         source_file = self.create_test_file("test.jpg")
@@ -220,7 +237,8 @@ class TestPhotoOrganizer(unittest.TestCase):
         organizer = PhotoOrganizer(
             str(self.source_dir),
             str(self.target_dir),
-            dry_run=False
+            dry_run=False,
+            max_workers=1
         )
         
         # Create target directory and existing file
@@ -261,6 +279,52 @@ class TestPhotoOrganizer(unittest.TestCase):
             self.assertEqual(stats['skipped'], 0)
             self.assertEqual(stats['errors'], 0)
 
+    @patch('data_recovery.sort_photos.Image')
+    def test_organize_photos_reuses_cache(self, mock_image):
+        """Test that a second run reads EXIF only for files changed since the first."""
+        mock_img = MagicMock()
+        mock_image.open.return_value.__enter__.return_value = mock_img
+        mock_img._getexif.return_value = {36867: "2023:12:25 14:30:22"}
+        cache_path = self.temp_dir / "exif.cache"
+
+        def run():
+            organizer = PhotoOrganizer(
+                str(self.source_dir),
+                str(self.target_dir),
+                dry_run=True,
+                max_workers=1,
+                cache_path=str(cache_path)
+            )
+            return organizer.organize_photos()
+
+        with patch('data_recovery.sort_photos.TAGS', {36867: 'DateTimeOriginal'}):
+            self.create_test_file("photo1.jpg")
+            photo2 = self.create_test_file("photo2.jpg")
+            self.assertEqual(run()['moved'], 2)
+            self.assertEqual(mock_image.open.call_count, 2)
+            self.assertTrue(cache_path.exists())
+
+            # Unchanged files come from the cache
+            mock_image.open.reset_mock()
+            self.assertEqual(run()['moved'], 2)
+            mock_image.open.assert_not_called()
+
+            # A changed file is read again
+            photo2.write_bytes(b"edited image data")
+            self.assertEqual(run()['moved'], 2)
+            self.assertEqual(mock_image.open.call_count, 1)
+
+            # Entries from another source tree sharing the cache survive this tree's runs
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+            self.assertEqual(sorted(Path(key[0]).name for key in cache), ["photo1.jpg", "photo2.jpg"])
+            cache[("/elsewhere/other.jpg", 0, 1)] = next(iter(cache.values()))
+            with open(cache_path, 'wb') as f:
+                pickle.dump(cache, f)
+            run()
+            with open(cache_path, 'rb') as f:
+                self.assertIn(("/elsewhere/other.jpg", 0, 1), pickle.load(f))
+
     @patch('data_recovery.sort_photos.Image')
     def test_organize_photos_with_skipped_files(self, mock_image):
         """Test workflow with photos that have no EXIF data."""
@@ -316,6 +380,19 @@ class TestPhotoOrganizer(unittest.TestCase):
         self.assertIn("deep.png", photo_names)
         self.assertNotIn("document.txt", photo_names)
 
+    def test_find_photo_files_threaded_matches_serial(self):
+        """Test that the threaded walk returns the serial walk's files in the same order."""
+        for name in ["b/2.jpg", "b/1.jpg", "a/x/3.png", "a/4.jpeg", "0.jpg"]:
+            self.create_test_file(name)
+
+        serial = PhotoOrganizer(str(self.source_dir), str(self.target_dir), dry_run=True, walk_workers=1)
+        expected = serial.find_photo_files()
+
+        self.assertEqual([f.relative_to(self.source_dir).as_posix() for f in expected],
+                         ["0.jpg", "a/4.jpeg", "a/x/3.png", "b/1.jpg", "b/2.jpg"])
+        for _ in range(5):
+            self.assertEqual(self.organizer.find_photo_files(), expected)
+
     def test_initialization(self):
         """Test PhotoOrganizer initialization."""
         organizer = PhotoOrganizer("/source", "/target", dry_run=True)
@@ -329,5 +406,57 @@ class TestPhotoOrganizer(unittest.TestCase):
         self.assertEqual(organizer.stats['errors'], 0)
 
 
+class TestPhotoOrganizerOnDisk(unittest.TestCase):
+    """Process pool tests; workers talk over real pipes, so these use a real filesystem."""
+
+    def setUp(self):
+        """Set up test fixtures on disk."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_dir / "source"
+        self.target_dir = self.temp_dir / "target"
+        self.source_dir.mkdir()
+        self.target_dir.mkdir()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_organize_photos_process_pool(self):
+        """Test that EXIF is read on a process pool when several workers are allowed."""
+        organizer = PhotoOrganizer(
+            str(self.source_dir),
+            str(self.target_dir),
+            dry_run=True,
+            max_workers=2
+        )
+
+        # Not real images, so every worker reports an error
+        for i in range(4):
+            (self.source_dir / f"broken{i}.jpg").write_bytes(b"fake image data")
+
+        stats = organizer.organize_photos()
+
+        self.assertEqual(stats['processed'], 4)
+        self.assertEqual(stats['moved'], 0)
+        self.assertEqual(stats['errors'], 4)
+
+    def test_move_file_cross_device_short_copy_file_range(self):
+        """Test that copy_file_range returning 0 early falls back to a full copy."""
+        organizer = PhotoOrganizer(str(self.source_dir), str(self.target_dir), dry_run=False, max_workers=1)
+        source_file = self.source_dir / "photo.jpg"
+        source_file.write_bytes(b"fake image data")
+        target_file = self.target_dir / "2020" / "01" / "photo.jpg"
+
+        with patch('data_recovery._fileops.os.replace',
+                   side_effect=OSError(errno.EXDEV, os.strerror(errno.EXDEV))), \
+                patch('data_recovery._fileops.os.copy_file_range', create=True, return_value=0), \
+                patch('data_recovery._fileops.shutil.copy2', wraps=shutil.copy2) as mock_copy2:
+            self.assertTrue(organizer.move_file(source_file, target_file))
+
+        mock_copy2.assert_called_once()
+        self.assertFalse(source_file.exists())
+        self.assertEqual(target_file.read_bytes(), b"fake image data")
+
+
 if __name__ == '__main__':
     unittest.main()
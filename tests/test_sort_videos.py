@@ -4,102 +4,111 @@ Tests for the video organizer script.
 """
 
 import unittest
-import tempfile
-import shutil
 import json
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import os
-import sys
+import uuid
 from datetime import datetime
+from typing import Optional
 import subprocess
 
-# Add the parent directory to the Python path so we can import the module
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from data_recovery.sort_videos import VideoOrganizer
 
 
+# The class-level patch replaces this; the ffprobe check tests call it directly
+REAL_CHECK_FFPROBE = VideoOrganizer._check_ffprobe
+
+SUPPORTED_VIDEO_FILES = frozenset({
+    "video.mp4", "video.mov", "video.avi", "video.mkv",
+    "video.wmv", "video.flv", "video.webm", "video.m4v",
+    "video.3gp", "video.mpg", "video.mpeg", "video.m2v",
+    "video.asf", "video.ts", "video.mts", "video.m2ts",
+    "VIDEO.MP4", "VIDEO.MOV"  # Test case sensitivity
+})
+
+UNSUPPORTED_FILES = frozenset({
+    "document.txt", "photo.jpg", "audio.mp3", "archive.zip"
+})
+
+
+def _ffprobe_output(tags: dict) -> Mock:
+    """A subprocess.run stand-in whose ffprobe JSON has the given format tags."""
+    return Mock(return_value=Mock(stdout=json.dumps({"format": {"tags": tags}}), returncode=0))
+
+
 class TestVideoOrganizer(unittest.TestCase):
     """Test cases for VideoOrganizer class."""
 
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _base_dir(cls, tmp_root):
+        """One directory shared by the tests in this class, under the per-process root.
+
+        It is removed with the root at the end of the session, so per-test
+        subdirectories are never walked twice.
+        """
+        cls.base_dir = tmp_root / uuid.uuid4().hex
+        cls.base_dir.mkdir()
+
+    @classmethod
+    def setUpClass(cls):
+        """Stub out the ffprobe check once instead of in every setUp."""
+        cls._ffprobe_patcher = patch.object(VideoOrganizer, '_check_ffprobe', return_value=True)
+        cls._ffprobe_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the ffprobe check."""
+        cls._ffprobe_patcher.stop()
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        """Set up test fixtures in a per-test subdirectory."""
+        self.temp_dir = self.base_dir / self._testMethodName
         self.source_dir = self.temp_dir / "source"
         self.target_dir = self.temp_dir / "target"
-        self.source_dir.mkdir()
+        self.source_dir.mkdir(parents=True)
         self.target_dir.mkdir()
 
-        # Mock ffprobe check to avoid dependency
-        with patch.object(VideoOrganizer, '_check_ffprobe', return_value=True):
-            self.organizer = VideoOrganizer(
-                str(self.source_dir),
-                str(self.target_dir),
-                dry_run=True
-            )
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
+        self.organizer = VideoOrganizer(
+            str(self.source_dir),
+            str(self.target_dir),
+            dry_run=True
+        )
 
-    def create_test_file(self, filename: str, content: bytes = b"fake video data") -> Path:
-        """Create a test file with given content."""
+    def create_test_file(self, filename: str, content: Optional[bytes] = None) -> Path:
+        """Create a test file, empty unless content is given (ffprobe is mocked, so it's rarely read)."""
         file_path = self.source_dir / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(content)
+        if content is None:
+            file_path.touch()
+        else:
+            file_path.write_bytes(content)
         return file_path
 
-    def test_sanitize_filename(self):
-        """Test filename sanitization."""
-        test_cases = [
-            ("Normal Video.mp4", "Normal Video.mp4"),
-            ("Video<with>bad:chars", "Video_with_bad_chars"),
-            ('Video"with|more?bad*chars', "Video_with_more_bad_chars"),
-            ("   .Leading dots and spaces   ", "Leading dots and spaces"),
-            ("", "Unknown"),
-            ("A" * 250, "A" * 200),  # Length limit
-        ]
-
-        for input_name, expected in test_cases:
-            with self.subTest(input_name=input_name):
-                result = self.organizer.sanitize_filename(input_name)
-                self.assertEqual(result, expected)
-
     def test_supported_formats(self):
         """Test that supported video formats are correctly identified."""
-        supported_files = [
-            "video.mp4", "video.mov", "video.avi", "video.mkv",
-            "video.wmv", "video.flv", "video.webm", "video.m4v",
-            "video.3gp", "video.mpg", "video.mpeg", "video.m2v",
-            "video.asf", "video.ts", "video.mts", "video.m2ts",
-            "VIDEO.MP4", "VIDEO.MOV"  # Test case sensitivity
-        ]
-        
-        unsupported_files = [
-            "document.txt", "photo.jpg", "audio.mp3", "archive.zip"
-        ]
-
         # Create test files
-        for filename in supported_files + unsupported_files:
+        for filename in SUPPORTED_VIDEO_FILES | UNSUPPORTED_FILES:
             self.create_test_file(filename)
 
-        video_files = self.organizer.find_video_files()
-        found_names = [f.name for f in video_files]
+        found_names = {f.name for f in self.organizer.find_video_files()}
 
         # Check all supported files are found
-        for filename in supported_files:
+        for filename in SUPPORTED_VIDEO_FILES:
             self.assertIn(filename, found_names)
 
         # Check unsupported files are not found
-        for filename in unsupported_files:
+        for filename in UNSUPPORTED_FILES:
             self.assertNotIn(filename, found_names)
 
     @patch('subprocess.run')
     def test_check_ffprobe_available(self, mock_run):
         """Test ffprobe availability check."""
         mock_run.return_value = None
-        result = self.organizer._check_ffprobe()
+        result = REAL_CHECK_FFPROBE(self.organizer)
         self.assertTrue(result)
         mock_run.assert_called_once_with(['ffprobe', '-version'], 
                                        capture_output=True, check=True)
@@ -108,7 +117,7 @@ class TestVideoOrganizer(unittest.TestCase):
     def test_check_ffprobe_not_available(self, mock_run):
         """Test ffprobe not available."""
         mock_run.side_effect = FileNotFoundError()
-        result = self.organizer._check_ffprobe()
+        result = REAL_CHECK_FFPROBE(self.organizer)
         self.assertFalse(result)
 
     def test_ffprobe_not_available_raises_error(self):
@@ -153,59 +162,6 @@ class TestVideoOrganizer(unittest.TestCase):
         result = self.organizer.extract_video_metadata(test_file)
         self.assertEqual(result, (None, False))
 
-    @patch('subprocess.run')
-    def test_extract_video_metadata_alternative_formats(self, mock_run):
-        """Test metadata extraction with various date formats."""
-        test_cases = [
-            ("2023-12-25T14:30:22Z", datetime(2023, 12, 25, 14, 30, 22)),
-            ("2023-12-25 14:30:22", datetime(2023, 12, 25, 14, 30, 22)),
-            ("2023:12:25 14:30:22", datetime(2023, 12, 25, 14, 30, 22)),
-            ("2023-12-25", datetime(2023, 12, 25, 0, 0, 0)),
-        ]
-
-        for date_str, expected_date in test_cases:
-            with self.subTest(date_str=date_str):
-                mock_metadata = {
-                    "format": {
-                        "tags": {
-                            "creation_time": date_str
-                        }
-                    }
-                }
-                mock_run.return_value.stdout = json.dumps(mock_metadata)
-                mock_run.return_value.returncode = 0
-
-                test_file = self.create_test_file("test.mp4")
-                result = self.organizer.extract_video_metadata(test_file)
-                self.assertEqual(result, (expected_date, False))
-
-    @patch('subprocess.run')
-    def test_extract_video_metadata_alternative_fields(self, mock_run):
-        """Test metadata extraction from alternative tag fields."""
-        alternative_fields = [
-            "date",
-            "com.apple.quicktime.creationdate",
-            "DATE_DIGITIZED",
-            "DATE"
-        ]
-
-        for field in alternative_fields:
-            with self.subTest(field=field):
-                mock_metadata = {
-                    "format": {
-                        "tags": {
-                            field: "2023-12-25T14:30:22.000000Z"
-                        }
-                    }
-                }
-                mock_run.return_value.stdout = json.dumps(mock_metadata)
-                mock_run.return_value.returncode = 0
-
-                test_file = self.create_test_file("test.mp4")
-                result = self.organizer.extract_video_metadata(test_file)
-                expected = (datetime(2023, 12, 25, 14, 30, 22), False)
-                self.assertEqual(result, expected)
-
     @patch('subprocess.run')
     def test_extract_video_metadata_ffprobe_error(self, mock_run):
         """Test handling of ffprobe errors."""
@@ -245,7 +201,10 @@ class TestVideoOrganizer(unittest.TestCase):
     def test_get_file_modification_date(self):
         """Test getting file modification date."""
         test_file = self.create_test_file("test.mp4")
-        result = self.organizer.get_file_modification_date(test_file)
+        with patch('os.stat', wraps=os.stat) as mock_stat:
+            result = self.organizer.get_file_modification_date(test_file)
+        # One stat per file; the fallback runs for every video without a date tag
+        self.assertEqual(mock_stat.call_count, 1)
         self.assertIsInstance(result, datetime)
         # Should be recent (within last minute)
         time_diff = datetime.now() - result
@@ -283,12 +242,11 @@ class TestVideoOrganizer(unittest.TestCase):
     def test_move_file_actual_move(self):
         """Test actual file moving when not in dry run mode."""
         # Create organizer without dry run
-        with patch.object(VideoOrganizer, '_check_ffprobe', return_value=True):
-            organizer = VideoOrganizer(
-                str(self.source_dir),
-                str(self.target_dir),
-                dry_run=False
-            )
+        organizer = VideoOrganizer(
+            str(self.source_dir),
+            str(self.target_dir),
+            dry_run=False
+        )
         
         test_file = self.create_test_file("test.mp4")
         target_path = self.target_dir / "moved.mp4"
@@ -302,12 +260,11 @@ class TestVideoOrganizer(unittest.TestCase):
     def test_move_file_duplicate_handling(self):
         """Test handling of duplicate files."""
         # Create organizer without dry run
-        with patch.object(VideoOrganizer, '_check_ffprobe', return_value=True):
-            organizer = VideoOrganizer(
-                str(self.source_dir),
-                str(self.target_dir),
-                dry_run=False
-            )
+        organizer = VideoOrganizer(
+            str(self.source_dir),
+            str(self.target_dir),
+            dry_run=False
+        )
         
         # Create target file that already exists
         target_path = self.target_dir / "moved.mp4"
@@ -326,26 +283,15 @@ class TestVideoOrganizer(unittest.TestCase):
         expected_duplicate = self.target_dir / "moved_1.mp4"
         self.assertTrue(expected_duplicate.exists())
 
-    @patch('subprocess.run')
-    def test_organize_videos_success(self, mock_run):
+    def test_organize_videos_success(self):
         """Test successful video organization."""
-        # Mock ffprobe output
-        mock_metadata = {
-            "format": {
-                "tags": {
-                    "creation_time": "2023-12-25T14:30:22.000000Z"
-                }
-            }
-        }
-        mock_run.return_value.stdout = json.dumps(mock_metadata)
-        mock_run.return_value.returncode = 0
-
         # Create test video files
         self.create_test_file("video1.mp4")
         self.create_test_file("video2.mov")
         self.create_test_file("document.txt")  # Should be ignored
 
-        stats = self.organizer.organize_videos()
+        with patch('subprocess.run', new=_ffprobe_output({"creation_time": "2023-12-25T14:30:22.000000Z"})):
+            stats = self.organizer.organize_videos()
 
         self.assertEqual(stats['processed'], 2)
         self.assertEqual(stats['moved'], 2)
@@ -355,21 +301,17 @@ class TestVideoOrganizer(unittest.TestCase):
     @patch('subprocess.run')
     def test_organize_videos_with_errors(self, mock_run):
         """Test video organization with some errors."""
-        # Mock ffprobe to fail for some files
+        # Mock ffprobe to fail for some files; results are built once and reused
+        good = Mock(
+            stdout=json.dumps({"format": {"tags": {"creation_time": "2023-12-25T14:30:22.000000Z"}}}),
+            returncode=0
+        )
+        bad = subprocess.CalledProcessError(1, 'ffprobe')
+
         def side_effect(*args, **kwargs):
             if 'video1.mp4' in str(args[0]):
-                raise subprocess.CalledProcessError(1, 'ffprobe')
-            else:
-                result = Mock()
-                result.stdout = json.dumps({
-                    "format": {
-                        "tags": {
-                            "creation_time": "2023-12-25T14:30:22.000000Z"
-                        }
-                    }
-                })
-                result.returncode = 0
-                return result
+                raise bad
+            return good
 
         mock_run.side_effect = side_effect
 
@@ -384,21 +326,13 @@ class TestVideoOrganizer(unittest.TestCase):
         self.assertEqual(stats['skipped'], 0)
         self.assertEqual(stats['errors'], 1)
 
-    @patch('subprocess.run')
-    def test_organize_videos_fallback_to_modification_date(self, mock_run):
+    def test_organize_videos_fallback_to_modification_date(self):
         """Test fallback to file modification date when no metadata date found."""
-        # Mock ffprobe to return no creation time
-        mock_metadata = {
-            "format": {
-                "tags": {}
-            }
-        }
-        mock_run.return_value.stdout = json.dumps(mock_metadata)
-        mock_run.return_value.returncode = 0
-
         test_file = self.create_test_file("video.mp4")
-        
-        stats = self.organizer.organize_videos()
+
+        # ffprobe reports no creation time
+        with patch('subprocess.run', new=_ffprobe_output({})):
+            stats = self.organizer.organize_videos()
 
         self.assertEqual(stats['processed'], 1)
         self.assertEqual(stats['moved'], 1)
@@ -444,7 +378,7 @@ class TestVideoOrganizer(unittest.TestCase):
         self.create_test_file("subdir1/subdir2/level2.avi")
         
         video_files = self.organizer.find_video_files()
-        found_names = [f.name for f in video_files]
+        found_names = {f.name for f in video_files}
         
         self.assertEqual(len(video_files), 3)
         self.assertIn("root.mp4", found_names)
@@ -452,5 +386,71 @@ class TestVideoOrganizer(unittest.TestCase):
         self.assertIn("level2.avi", found_names)
 
 
-if __name__ == '__main__':
-    unittest.main()
+    def test_find_video_files_skips_non_video_fast(self):
+        """Test that non-video files are filtered by name without being stat'ed."""
+        for i in range(500):
+            self.create_test_file(f"notes{i}.txt")
+        for i in range(5):
+            self.create_test_file(f"clip{i}.mp4")
+
+        real_stat = Path.stat
+        with patch.object(Path, 'stat', autospec=True, side_effect=real_stat) as mock_stat:
+            video_files = self.organizer.find_video_files()
+
+        self.assertEqual(sorted(f.name for f in video_files), [f"clip{i}.mp4" for i in range(5)])
+        mock_stat.assert_not_called()
+
+
+# Data-driven cases run as separate pytest tests, so each case passes or
+# fails on its own and xdist can spread them across workers
+
+@pytest.fixture(scope="module")
+def organizer():
+    """A dry-run organizer; these tests mock ffprobe and never touch its directories."""
+    with patch.object(VideoOrganizer, '_check_ffprobe', return_value=True):
+        return VideoOrganizer("source", "target", dry_run=True)
+
+
+@pytest.mark.parametrize("input_name,expected", [
+    ("Normal Video.mp4", "Normal Video.mp4"),
+    ("Video<with>bad:chars", "Video_with_bad_chars"),
+    ('Video"with|more?bad*chars', "Video_with_more_bad_chars"),
+    ("   .Leading dots and spaces   ", "Leading dots and spaces"),
+    ("", "Unknown"),
+])
+def test_sanitize_filename(organizer, input_name, expected):
+    """Test filename sanitization."""
+    assert organizer.sanitize_filename(input_name) == expected
+
+
+def test_sanitize_filename_length_limit(organizer):
+    """Test that long names are cut to 200 characters."""
+    result = organizer.sanitize_filename("A" * 250)
+    assert len(result) == 200
+    assert set(result) == {"A"}
+
+
+@pytest.mark.parametrize("date_str,expected_date", [
+    ("2023-12-25T14:30:22Z", datetime(2023, 12, 25, 14, 30, 22)),
+    ("2023-12-25 14:30:22", datetime(2023, 12, 25, 14, 30, 22)),
+    ("2023:12:25 14:30:22", datetime(2023, 12, 25, 14, 30, 22)),
+    ("2023-12-25", datetime(2023, 12, 25, 0, 0, 0)),
+])
+def test_extract_video_metadata_alternative_formats(organizer, date_str, expected_date):
+    """Test metadata extraction with various date formats."""
+    with patch('subprocess.run', new=_ffprobe_output({"creation_time": date_str})):
+        result = organizer.extract_video_metadata(Path("test.mp4"))
+    assert result == (expected_date, False)
+
+
+@pytest.mark.parametrize("field", [
+    "date",
+    "com.apple.quicktime.creationdate",
+    "DATE_DIGITIZED",
+    "DATE",
+])
+def test_extract_video_metadata_alternative_fields(organizer, field):
+    """Test metadata extraction from alternative tag fields."""
+    with patch('subprocess.run', new=_ffprobe_output({field: "2023-12-25T14:30:22.000000Z"})):
+        result = organizer.extract_video_metadata(Path("test.mp4"))
+    assert result == (datetime(2023, 12, 25, 14, 30, 22), False)
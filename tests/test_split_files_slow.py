@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Slow-tier tests for the split_files module: full splits over real directory trees.
+
+Deselected by default; run them with ``python -m pytest -m slow``.
+"""
+
+import os
+import uuid
+
+import pytest
+
+from data_recovery.split_files import FileSplitter
+from tests.conftest import create_sparse_files, fast_rmtree
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture
+def split_dirs(tmp_root):
+    """Source and output directories under a directory of the test's own."""
+    root = tmp_root / uuid.uuid4().hex
+    source_dir = root / "source"
+    output_dir = root / "output"
+    source_dir.mkdir(parents=True)
+    output_dir.mkdir()
+    yield source_dir, output_dir
+    fast_rmtree(root)
+
+
+def test_integration_full_split(split_dirs):
+    """Integration test for complete split operation."""
+    source_dir, output_dir = split_dirs
+    splitter = FileSplitter(max_size_gb=0.01, dry_run=False)  # 10MB
+
+    # Create a set of files that will require multiple splits
+    create_sparse_files(source_dir, [
+        ("large1.jpg", 8.0),   # 8MB
+        ("large2.jpg", 7.0),   # 7MB
+        ("medium1.pdf", 4.0),  # 4MB
+        ("medium2.pdf", 3.0),  # 3MB
+        ("small1.txt", 1.0),   # 1MB
+        ("small2.txt", 1.0),   # 1MB
+    ])
+
+    # Perform the split
+    splitter.split_directory(source_dir, output_dir)
+
+    # Verify source directory is empty (files moved)
+    assert list(source_dir.glob("*")) == []
+
+    # Verify output directories were created
+    with os.scandir(output_dir) as it:
+        batch_dirs = sorted((e for e in it if e.name.startswith("batch_")), key=lambda e: e.name)
+    assert len(batch_dirs) > 0
+
+    # Verify all files were moved
+    total_files_moved = 0
+    for batch_dir in batch_dirs:
+        # One scandir pass counts the files and sums their sizes
+        batch_size = 0
+        with os.scandir(batch_dir.path) as it:
+            for entry in it:
+                if entry.is_file():
+                    total_files_moved += 1
+                    batch_size += entry.stat().st_size
+
+        # Verify batch size doesn't exceed limit (with small tolerance for rounding)
+        assert batch_size <= splitter.max_size_bytes * 1.1  # 10% tolerance
+
+    assert total_files_moved == 6  # All 6 files should be moved